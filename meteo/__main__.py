@@ -1,26 +1,81 @@
 """
 Point d'entrée de l'application.
 Responsable de la configuration et de l'assemblage des composants.
+
+Usage :
+    python -m meteo                                  # application interactive
+    python -m meteo export --all --format csv --out DIR
+    python -m meteo export --city Toulouse --all --format parquet --out DIR
+    python -m meteo export --all --format memmap --out DIR   # tableaux pour l'analyse
+    python -m meteo serve [--host HOST] [--port PORT]
+    python -m meteo --offline ...                    # historique local uniquement
 """
+import argparse
+import sys
 
 # --- Imports des classes concrètes ---
+# L'interface interactive (rich, questionary) n'est importée qu'en mode interactif
 from .loaders.station_data_loader import StationDataLoader
 from .extractors.data_extractor import DataExtractor
 from .filters.city_filter import CityFilter
 from .filters.keyword_filter import KeywordFilter
 from .filters.column_filter import ColumnFilter
 from .filters.composite_filter import CompositeFilter
-from .ui.interactive_ui import InteractiveConsoleUI
+from .filters.dtype_filter import DtypeFilter
+from .filters.filter_decorators import MemoizingDecorator
 from .services.weather_data_service import WeatherDataService
 from .services.user_selection_service import UserSelectionService
+from .services.station_prefetcher import StationPrefetcher
+from .services.station_export_service import StationExportService
+from .services.aggregation_service import StationAggregationService
+from .services.station_panel_builder import StationPanelBuilder
+from .server.weather_api_server import WeatherApiServer
 from .orchestrator.weather_station_orchestrator import WeatherStationOrchestrator
 from .factories.station_navigator_factory import StationNavigatorFactory
 from .loaders.cities_loader import CitiesLoader
+from .loaders.http_client import HttpClient
+from .storage.http_cache import HttpResponseCache
+from .storage.catalog_snapshot import CatalogSnapshotStore
+from .storage.dataframe_cache import DataFrameCache
+from .storage.time_series_store import StationTimeSeriesStore
 from .config_loader import load_config
 
 
-def main():
+def parse_arguments(argv=None) -> argparse.Namespace:
+    """Analyse la ligne de commande (sans sous-commande : mode interactif)."""
+    parser = argparse.ArgumentParser(prog="python -m meteo", description="Données des stations météo.")
+    parser.add_argument("--offline", action="store_true",
+                        help="Lit les données de station depuis l'historique local, sans appel à l'API.")
+    subparsers = parser.add_subparsers(dest="command")
+
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Exporte les données de stations sans interaction (tâches planifiées)."
+    )
+    export_parser.add_argument("--city", action="append", dest="cities", metavar="VILLE",
+                               help="Ville à exporter (répétable). Toutes les villes si absent.")
+    selection = export_parser.add_mutually_exclusive_group(required=True)
+    selection.add_argument("--all", action="store_true",
+                           help="Exporte toutes les stations des villes retenues (exclusif de --station).")
+    selection.add_argument("--station", action="append", dest="stations", metavar="ID",
+                           help="Identifiant de station à exporter (répétable).")
+    export_parser.add_argument("--format", dest="file_format", default="csv",
+                               choices=StationExportService.AVAILABLE_FORMATS, help="Format des fichiers.")
+    export_parser.add_argument("--out", required=True, metavar="DIR", help="Répertoire de destination.")
+
+    serve_parser = subparsers.add_parser(
+        "serve",
+        help="Expose les villes, stations et données via une API HTTP locale."
+    )
+    serve_parser.add_argument("--host", help="Adresse d'écoute (défaut : configuration).")
+    serve_parser.add_argument("--port", type=int, help="Port d'écoute (défaut : configuration).")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Charge la config, configure les composants et exécute l'application."""
+    args = parse_arguments(argv)
 
     # =========================================================================
     # 1. CHARGEMENT DE LA CONFIGURATION EXTERNE
@@ -32,11 +87,41 @@ def main():
     # =========================================================================
 
     # --- Couche d'accès aux données (Loaders) ---
-    cities_loader = CitiesLoader(catalog_url=config['api']['cities_url'])
-    station_loader = StationDataLoader(api_url_template=config['api']['station_template_url'])
+    # Un seul client HTTP poolé est partagé pour réutiliser les connexions keep-alive
+    http_client = HttpClient(
+        pool_size=config['http']['pool_size'],
+        connect_timeout=config['http']['connect_timeout'],
+        read_timeout=config['http']['read_timeout'],
+        max_retries=config['http']['max_retries'],
+        backoff_factor=config['http']['backoff_factor'],
+        max_per_host=config['http']['max_per_host']
+    )
 
-    # --- Couche de présentation (UI) ---
-    ui = InteractiveConsoleUI()
+    # Cache disque : le catalogue n'est retéléchargé que s'il a changé côté API
+    response_cache = HttpResponseCache(cache_dir=config['cache']['http_directory'])
+
+    # Filtre des stations météo, appliqué dès le parsing de chaque bloc du catalogue
+    meteo_keyword_filter = KeywordFilter(
+        column_name=config['columns']['station_id'],
+        include_keyword=config['filters']['meteo_keyword'],
+        exclude_keyword=config['filters']['archive_keyword']
+    )
+
+    cities_loader = CitiesLoader(
+        catalog_url=config['api']['cities_url'],
+        http_client=http_client,
+        response_cache=response_cache,
+        server_fields=config['api']['catalog_server_fields'],
+        columns=config['columns']['catalog_to_keep'],
+        chunk_filter=meteo_keyword_filter,
+        chunk_size=config['http']['catalog_chunk_size']
+    )
+    station_loader = StationDataLoader(
+        api_url_template=config['api']['station_template_url'],
+        http_client=http_client,
+        export_url_template=config['api']['station_export_template_url'],
+        timestamp_field=config['columns']['timestamp']
+    )
 
     # --- Couche de traitement (Filtres & Extracteur) ---
     extractor = DataExtractor(
@@ -45,19 +130,64 @@ def main():
         timestamp_col=config['columns']['timestamp']
     )
 
-    meteo_keyword_filter = KeywordFilter(
-        column_name=config['columns']['station_id'],
-        include_keyword=config['filters']['meteo_keyword'],
-        exclude_keyword=config['filters']['archive_keyword']
-    )
-
     city_filter_factory = lambda city: CityFilter(column_name=config['columns']['city'], city_name=city)
 
+    # Option : mémorisation des filtres de ville (un seul cache partagé par toutes les villes).
+    # L'index applique chaque filtre une seule fois : seules les recherches répétées d'une
+    # ville absente de l'index (saisie libre) sur le catalogue courant en profitent.
+    if config['cache']['filter_memoize']:
+        filter_cache = DataFrameCache(max_bytes=config['cache']['filter_max_bytes'])
+        build_city_filter = city_filter_factory
+        city_filter_factory = lambda city: MemoizingDecorator(build_city_filter(city), cache=filter_cache)
+
     station_data_column_filter = ColumnFilter(columns_to_keep=config['columns']['meteo_to_keep'])
 
     navigator_factory = StationNavigatorFactory()
 
-    catalog_processing_pipeline = CompositeFilter([meteo_keyword_filter])
+    # Types compacts : catégories pour le catalogue, horodatages parsés et float32 pour les mesures
+    catalog_dtype_filter = DtypeFilter(
+        category_columns=config['dtypes']['catalog_categories'],
+        report_memory=config['dtypes']['report_memory']
+    )
+    station_dtype_filter = DtypeFilter(
+        datetime_columns=config['dtypes']['station_datetimes'],
+        float32_columns=config['dtypes']['station_float32'],
+        timezone=config['dtypes']['timezone'],
+        report_memory=config['dtypes']['report_memory']
+    )
+
+    catalog_processing_pipeline = CompositeFilter([meteo_keyword_filter, catalog_dtype_filter])
+
+    # Catalogue déjà filtré, réutilisé tant que la source et les filtres sont inchangés
+    catalog_snapshot = CatalogSnapshotStore(
+        directory=config['cache']['snapshot_directory'],
+        file_format=config['cache']['snapshot_format']
+    )
+
+    # Données de station récentes gardées en mémoire (rafraîchies au rythme des stations)
+    station_cache = DataFrameCache(
+        max_bytes=config['cache']['station_max_bytes'],
+        max_entries=config['cache']['station_max_entries'],
+        ttl=config['cache']['station_ttl']
+    )
+
+    # Historique local des relevés, partitionné par station et par jour
+    time_series_store = None
+    if config['store']['enabled']:
+        time_series_store = StationTimeSeriesStore(
+            directory=config['store']['directory'],
+            timestamp_col=config['columns']['timestamp'],
+            file_format=config['store']['format'],
+            timezone=config['dtypes']['timezone']
+        )
+
+    # Alignement des stations d'une ville sur une grille commune, pour les comparer
+    panel_builder = StationPanelBuilder(
+        timestamp_col=config['columns']['timestamp'],
+        value_columns=config['columns']['aggregated_measures'],
+        frequency=config['panel']['frequency'],
+        tolerance=config['panel']['tolerance']
+    )
 
     # --- Couche de Services (Coordination) ---
     data_service = WeatherDataService(
@@ -67,23 +197,118 @@ def main():
         city_filter_factory=city_filter_factory,
         column_filter=station_data_column_filter,
         extractor=extractor,
-        navigator_factory = navigator_factory
+        navigator_factory = navigator_factory,
+        catalog_snapshot=catalog_snapshot,
+        station_dtype_filter=station_dtype_filter,
+        max_workers=config['prefetch']['max_workers'],
+        station_timeout=config['prefetch']['station_timeout'],
+        station_cache=station_cache,
+        incremental_refresh=config['cache']['station_incremental'],
+        panel_builder=panel_builder,
+        time_series_store=time_series_store,
+        store_window=config['store']['window'],
+        offline=args.offline or config['store']['offline']
     )
 
+    # =========================================================================
+    # 3. LANCEMENT DE L'APPLICATION
+    # =========================================================================
+    try:
+        if args.command == "export":
+            return run_export(data_service, args, config)
+        if args.command == "serve":
+            return run_server(data_service, args, config)
+        run_interactive(data_service, config)
+    finally:
+        http_client.close()
+
+
+def run_export(data_service: WeatherDataService, args: argparse.Namespace, config) -> int:
+    """
+    Exporte les stations demandées et affiche un résumé.
+
+    Returns:
+        int: Le code de sortie (1 si le catalogue est indisponible, si l'export
+             est impossible ou si au moins une station a échoué).
+    """
+    try:
+        export_service = StationExportService(
+            data_service,
+            file_format=args.file_format,
+            measure_columns=config['columns']['aggregated_measures']
+        )
+    except (ValueError, ImportError) as e:
+        print(f"Export impossible : {e}", file=sys.stderr)
+        return 1
+
+    if data_service.get_processed_catalog().empty:
+        print("Export impossible : le catalogue des stations est indisponible.", file=sys.stderr)
+        return 1
+
+    # --all : aucune restriction de stations (exclusif de --station)
+    station_ids = None if args.all else args.stations
+    try:
+        manifest = export_service.export(args.out, cities=args.cities, station_ids=station_ids)
+    except OSError as e:
+        print(f"Export impossible : {e}", file=sys.stderr)
+        return 1
+
+    exported = sum(entry["status"] == "ok" for entry in manifest["stations"])
+    empty = sum(entry["status"] == "empty" for entry in manifest["stations"])
+    print(f"{exported} station(s) exportée(s) dans '{args.out}', {empty} sans relevé, "
+          f"{manifest['failed']} en échec.")
+    for entry in manifest["stations"]:
+        if entry["status"] == "error":
+            print(f"  ✗ {entry['station_id']} : {entry['error']}", file=sys.stderr)
+
+    return 1 if manifest["failed"] else 0
+
+
+def run_server(data_service: WeatherDataService, args: argparse.Namespace, config) -> None:
+    """Lance l'API HTTP locale jusqu'à son interruption."""
+    server = WeatherApiServer(
+        data_service=data_service,
+        host=args.host or config['server']['host'],
+        port=args.port or config['server']['port'],
+        max_workers=config['server']['max_workers'],
+        aggregation_service=StationAggregationService(
+            timestamp_col=config['columns']['timestamp'],
+            value_columns=config['columns']['aggregated_measures'],
+            timezone=config['dtypes']['timezone']
+        )
+    )
+    server.run()
+
+
+def run_interactive(data_service: WeatherDataService, config) -> None:
+    """Assemble l'interface console et lance l'orchestrateur."""
+    from .ui.interactive_ui import InteractiveConsoleUI
+
+    # --- Couche de présentation (UI) ---
+    ui = InteractiveConsoleUI()
+
     selection_service = UserSelectionService(ui=ui)
 
+    # Stations voisines chargées en arrière-plan pendant la navigation
+    station_prefetcher = StationPrefetcher(
+        load=data_service.get_station_data,
+        max_workers=config['prefetch']['neighbour_workers']
+    )
+
     # --- Orchestrateur ---
     orchestrator = WeatherStationOrchestrator(
         data_service=data_service,
         selection_service=selection_service,
-        ui=ui
+        ui=ui,
+        prefetch_city=config['prefetch']['city_wide'],
+        station_prefetcher=station_prefetcher
     )
 
-    # =========================================================================
-    # 3. LANCEMENT DE L'APPLICATION
-    # =========================================================================
-    orchestrator.run()
+    try:
+        orchestrator.run()
+    finally:
+        station_prefetcher.close()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
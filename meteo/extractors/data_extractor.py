@@ -1,7 +1,7 @@
 """ Extracteur de données configuré pour un type de DataFrame spécifique. """
 from typing import List, Any
+import numpy as np
 import pandas as pd
-import re
 
 
 class DataExtractor:
@@ -65,10 +65,42 @@ class DataExtractor:
             raise KeyError(f"La colonne '{column_name}' est introuvable.")
 
         # Extraire les valeurs uniques
-        values = df[column_name].dropna().drop_duplicates().tolist()
+        values = df[column_name].dropna().drop_duplicates()
 
-        # Tri des résultats
-        def natural_sort_key(text):
-            return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', str(text))]
+        # Tri des résultats (clés calculées en une passe sur toute la colonne)
+        return values.iloc[self.natural_sort_order(values)].tolist()
 
-        return sorted(values, key=natural_sort_key)
+    @staticmethod
+    def natural_sort_keys(values: pd.Series) -> pd.Series:
+        """
+        Calcule les clés de tri naturel d'une colonne, en une seule passe.
+
+        Chaque nombre est complété par des zéros à une largeur commune et précédé
+        d'un séparateur inférieur à tout caractère : comparer les clés comme de
+        simples chaînes donne le même ordre que comparer les listes
+        [texte, nombre, texte, ...] du tri naturel ("station2" < "station10").
+
+        Args:
+            values (Series): Les valeurs à trier.
+
+        Returns:
+            Series: Les clés de tri, alignées sur les valeurs.
+        """
+        text = values.astype(str).str.lower()
+        digit_runs = text.str.extractall(r"(\d+)")[0]
+        width = int(digit_runs.str.len().max()) if not digit_runs.empty else 1
+        return text.str.replace(r"\d+", lambda match: "\x00" + match.group().zfill(width), regex=True)
+
+    @classmethod
+    def natural_sort_order(cls, values: pd.Series) -> np.ndarray:
+        """
+        Retourne les positions qui trient une colonne dans l'ordre naturel.
+        Le tri est stable : les valeurs de même clé gardent leur ordre d'origine.
+
+        Args:
+            values (Series): Les valeurs à trier.
+
+        Returns:
+            ndarray: Les positions triées (utilisables avec iloc).
+        """
+        return np.argsort(cls.natural_sort_keys(values).to_numpy(dtype=object), kind="stable")
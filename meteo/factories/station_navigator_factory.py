@@ -1,9 +1,11 @@
 """Factory pour créer des navigateurs de stations."""
-from typing import List
-import re
+from typing import List, Optional, Type
+import numpy as np
+import pandas as pd
 from ..models.station import Station
 from ..interfaces.navigation_interface import StationNavigator
-from ..services.station_linked_list import StationLinkedList
+from ..services.station_array_navigator import StationArrayNavigator
+from ..services.station_registry import StationRegistry
 
 
 class StationNavigatorFactory:
@@ -12,30 +14,65 @@ class StationNavigatorFactory:
   Les stations sont automatiquement triées par ordre alphabétique d'ID.
   """
 
-  def create_from_station_list(self, stations: List[Station]) -> StationNavigator:
+  def __init__(self, navigator_class: Type[StationNavigator] = StationArrayNavigator):
+      """
+      Initialise la factory.
+
+      Args:
+          navigator_class (Type[StationNavigator]): L'implémentation à construire. Elle
+              doit proposer add_station() (StationArrayNavigator, StationLinkedList...).
+      """
+      self.navigator_class = navigator_class
+
+  @staticmethod
+  def get_sort_keys(station_ids: pd.Series) -> pd.Series:
+      """
+      Calcule les clés de tri des stations : le nom sans le préfixe numérique,
+      en minuscules (ex: '42-meteo-blagnac' -> 'meteo-blagnac').
+
+      Args:
+          station_ids (Series): Les identifiants des stations.
+
+      Returns:
+          Series: Les clés de tri, alignées sur les identifiants.
+      """
+      # Retire le préfixe numérique au début (ex: "42-") en une passe sur toute la colonne
+      return station_ids.astype(str).str.replace(r'^\d+-', '', regex=True).str.lower()
+
+  def create_from_station_list(
+      self,
+      stations: List[Station],
+      registry: Optional[StationRegistry] = None,
+      presorted: bool = False
+  ) -> StationNavigator:
       """
       Crée un navigateur de stations à partir d'une liste de stations.
       Les stations sont triées par nom (sans le préfixe numérique).
 
       Args:
           stations (List[Station]): La liste des stations à organiser.
+          registry (Optional[StationRegistry]): Registre partagé, transmis aux
+              navigateurs qui le prennent en charge (StationArrayNavigator).
+          presorted (bool): True si les stations sont déjà dans l'ordre de
+              get_sort_keys (par exemple fournies par l'index du catalogue).
 
       Returns:
           StationNavigator: Un navigateur de stations configuré et trié.
       """
-      def get_name_without_prefix(station_id: str) -> str:
-          """Extrait le nom sans le préfixe numérique (ex: '42-meteo-blagnac' -> 'meteo-blagnac')"""
-          # Retire le préfixe numérique au début (ex: "42-")
-          return re.sub(r'^\d+-', '', station_id).lower()
-
-      # Trier les stations par nom (sans préfixe numérique), ordre alphabétique
-      sorted_stations = sorted(stations, key=lambda s: get_name_without_prefix(s.dataset_id))
+      sorted_stations = stations
+      if not presorted:
+          # Trier les stations par nom (sans préfixe numérique), ordre alphabétique
+          keys = self.get_sort_keys(pd.Series([s.dataset_id for s in stations], dtype=object))
+          sorted_stations = [stations[i] for i in np.argsort(keys.to_numpy(), kind="stable")]
 
-      # Créer la liste chaînée
-      linked_list = StationLinkedList()
+      # Créer le navigateur
+      if registry is not None and issubclass(self.navigator_class, StationArrayNavigator):
+          navigator = self.navigator_class(registry=registry)
+      else:
+          navigator = self.navigator_class()
 
-      # Ajouter toutes les stations à la liste
+      # Ajouter toutes les stations au navigateur
       for station in sorted_stations:
-          linked_list.add_station(station)
+          navigator.add_station(station)
 
-      return linked_list
\ No newline at end of file
+      return navigator
\ No newline at end of file
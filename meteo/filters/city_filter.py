@@ -1,6 +1,8 @@
 """Filtre pour sélectionner des données basées sur une colonne de type texte."""
 import pandas as pd
+from typing import Optional, List
 from ..interfaces.base_interfaces import DataFilter
+from ..models.column_predicate import ColumnPredicate
 
 
 class CityFilter(DataFilter):
@@ -19,15 +21,33 @@ class CityFilter(DataFilter):
         self.column_name = column_name
         self.city_name = city_name
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_server_predicates(self) -> Optional[List[ColumnPredicate]]:
         """
-        Applique le filtre sur le DataFrame.
+        Traduit la recherche de la ville en prédicat.
+
+        Returns:
+            Optional[List[ColumnPredicate]]: Le prédicat équivalent au filtre.
+        """
+        return [ColumnPredicate(self.column_name, self.city_name)]
+
+    def get_required_columns(self) -> Optional[List[str]]:
+        """
+        Retourne la colonne lue par le filtre.
+
+        Returns:
+            Optional[List[str]]: La colonne filtrée.
+        """
+        return [self.column_name]
+
+    def build_mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Calcule le masque booléen des lignes correspondant à la ville.
 
         Args:
-            df (DataFrame): Le DataFrame à filtrer.
+            df (DataFrame): Le DataFrame à évaluer.
 
         Returns:
-            DataFrame: Un nouveau DataFrame contenant uniquement la colonne voulus.
+            Series: True pour chaque ligne à conserver.
 
         Raises:
             KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
@@ -40,10 +60,23 @@ class CityFilter(DataFilter):
             )
 
         # Condition de filtrage
-        condition = df[self.column_name].str.contains(
+        return df[self.column_name].str.contains(
             self.city_name, case=False, na=False
         )
 
-        filtered_df = df[condition].copy()
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applique le filtre sur le DataFrame.
+
+        Args:
+            df (DataFrame): Le DataFrame à filtrer.
+
+        Returns:
+            DataFrame: Un nouveau DataFrame contenant uniquement la colonne voulus.
+
+        Raises:
+            KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
+        """
+        filtered_df = df[self.build_mask(df)].copy()
 
         return filtered_df
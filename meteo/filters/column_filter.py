@@ -1,6 +1,6 @@
 """Filtre pour sélectionner un sous-ensemble de colonnes d'un DataFrame."""
 import pandas as pd
-from typing import List
+from typing import List, Optional
 from ..interfaces.base_interfaces import DataFilter
 
 
@@ -16,6 +16,15 @@ class ColumnFilter(DataFilter):
         """
         self.columns_to_keep = columns_to_keep
 
+    def get_projection(self) -> Optional[List[str]]:
+        """
+        Retourne les colonnes à conserver, transmissibles à la source de données.
+
+        Returns:
+            Optional[List[str]]: La liste des colonnes à garder.
+        """
+        return list(self.columns_to_keep)
+
     def filter(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Filtre le DataFrame pour ne conserver que les colonnes spécifiées.
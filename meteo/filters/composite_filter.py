@@ -1,7 +1,11 @@
 """ Implémentation du Design Pattern Composite pour enchaîner plusieurs filtres. """
+import time
+import numpy as np
 import pandas as pd
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from ..interfaces.base_interfaces import DataFilter
+from ..models.column_predicate import ColumnPredicate
+from .filter_statistics import FilterStatistics
 from .queue_structure import Queue
 
 
@@ -11,15 +15,27 @@ class CompositeFilter(DataFilter):
     Respecte le principe FIFO (First In, First Out).
     """
 
-    def __init__(self, filters: Optional[List[DataFilter]] = None):
+    def __init__(
+        self,
+        filters: Optional[List[DataFilter]] = None,
+        compiled: bool = True,
+        adaptive: bool = True
+    ):
         """
         Initialise le filtre composite avec une file.
 
         Args:
             filters (Optional[List[DataFilter]]): Liste optionnelle de filtres initiaux.
+            compiled (bool): Active l'exécution compilée (masques fusionnés,
+                             une seule matérialisation du résultat).
+            adaptive (bool): En mode compilé, réordonne les filtres de lignes
+                             selon leur coût et leur sélectivité mesurés.
         """
 
         self._filter_queue = Queue()
+        self.compiled = compiled
+        self.adaptive = adaptive
+        self._statistics: Dict[DataFilter, FilterStatistics] = {}
 
         if filters is not None:
             for data_filter in filters:
@@ -44,8 +60,12 @@ class CompositeFilter(DataFilter):
         """
         Applique chaque filtre de la file au DataFrame, l'un après l'autre.
 
-        La file n'est pas vidée définitivement: les filtres sont temporairement
-        extraits puis remis dans la file pour permettre une réutilisation.
+        La file n'est pas modifiée : elle est simplement parcourue, ce qui
+        permet de réutiliser le composite.
+
+        En mode compilé, les filtres de lignes fournissent un masque booléen
+        (combinés par un ET logique) et les filtres de colonnes une projection :
+        le résultat n'est matérialisé qu'une seule fois, à la fin.
 
         Args:
             df (DataFrame): Le DataFrame initial à filtrer.
@@ -53,23 +73,218 @@ class CompositeFilter(DataFilter):
         Returns:
             DataFrame: Le DataFrame final après l'application de tous les filtres.
         """
+        if self.compiled:
+            return self._filter_compiled(df)
+
         processed_df = df.copy()
 
-        temp_filters = []
+        for current_filter in self._filter_queue:
+            processed_df = current_filter.filter(processed_df)
 
-        while not self._filter_queue.is_empty():
-            current_filter = self._filter_queue.dequeue()
+        return processed_df
 
-            processed_df = current_filter.filter(processed_df)
+    def _filter_compiled(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Exécute le pipeline en fusionnant les masques et les projections.
 
-            temp_filters.append(current_filter)
+        Chaque filtre de lignes n'évalue que les lignes encore conservées ; dès que
+        plus aucune ligne ne subsiste, les masques restants sont sautés (ou évalués
+        sur une vue vide) et les projections ignorées. Un filtre qui n'est ni une
+        sélection de lignes ni une projection force la matérialisation du résultat
+        intermédiaire avant d'être appliqué normalement, y compris sur un résultat
+        vide : les types obtenus sont ceux du mode séquentiel.
 
-        # Remettre tous les filtres dans la queue pour préserver l'état
-        # (permet de réutiliser le CompositeFilter plusieurs fois)
-        for filter_item in temp_filters:
-            self._filter_queue.enqueue(filter_item)
+        Args:
+            df (DataFrame): Le DataFrame initial à filtrer.
 
-        return processed_df
+        Returns:
+            DataFrame: Le DataFrame final (une seule copie des données conservées).
+        """
+        base = df
+        # Positions des lignes conservées dans `base` (None : toutes les lignes)
+        positions: Optional[np.ndarray] = None
+        columns: Optional[List[str]] = None
+
+        for current_filter in self._get_execution_plan():
+            rows_in = len(base) if positions is None else positions.size
+            if rows_in == 0 and self._is_known_row_filter(current_filter):
+                # Plus aucune ligne : le masque est inutile
+                continue
+
+            started = time.perf_counter()
+            row_mask = current_filter.build_mask(self._get_mask_view(base, positions, columns, current_filter))
+
+            if row_mask is not None:
+                row_mask = np.asarray(row_mask, dtype=bool)
+                positions = np.flatnonzero(row_mask) if positions is None else positions[row_mask]
+                if rows_in:
+                    self._record(current_filter, started, rows_in, positions.size, is_row_filter=True)
+                continue
+
+            projection = current_filter.get_projection()
+            if projection is not None:
+                current_columns = list(base.columns) if columns is None else columns
+                # Comme ColumnFilter, une projection sur un résultat vide garde toutes les colonnes
+                if current_columns and rows_in:
+                    columns = [col for col in projection if col in current_columns]
+                self._record(current_filter, started, rows_in, rows_in)
+                continue
+
+            # Filtre opaque : on matérialise puis on l'applique tel quel
+            base = current_filter.filter(self._materialize(base, positions, columns))
+            positions, columns = None, None
+            self._record(current_filter, started, rows_in, len(base))
+
+        if base is df or positions is not None or columns is not None:
+            return self._materialize(base, positions, columns)
+        return base
+
+    def _is_known_row_filter(self, data_filter: DataFilter) -> bool:
+        """Indique si les statistiques mesurées désignent un filtre de lignes."""
+        statistics = self._statistics.get(data_filter)
+        return statistics is not None and statistics.is_row_filter
+
+    def _get_execution_plan(self) -> List[DataFilter]:
+        """
+        Détermine l'ordre d'exécution des filtres.
+
+        En mode adaptatif, chaque suite de filtres de lignes consécutifs (qui
+        commutent entre eux) est réordonnée selon les statistiques mesurées :
+        les filtres peu coûteux et très sélectifs passent en premier. Les autres
+        filtres gardent leur place.
+
+        Returns:
+            List[DataFilter]: Les filtres dans l'ordre d'exécution.
+        """
+        filters = self._get_filters()
+        if not self.adaptive:
+            return filters
+
+        plan: List[DataFilter] = []
+        row_filters: List[DataFilter] = []
+        for data_filter in filters:
+            statistics = self._statistics.get(data_filter)
+            if statistics is not None and statistics.is_row_filter:
+                row_filters.append(data_filter)
+                continue
+            plan.extend(sorted(row_filters, key=lambda f: self._statistics[f].rank))
+            row_filters = []
+            plan.append(data_filter)
+
+        plan.extend(sorted(row_filters, key=lambda f: self._statistics[f].rank))
+        return plan
+
+    @staticmethod
+    def _get_mask_view(
+        base: pd.DataFrame,
+        positions: Optional[np.ndarray],
+        columns: Optional[List[str]],
+        data_filter: DataFilter
+    ) -> pd.DataFrame:
+        """
+        Construit la vue évaluée par un filtre de lignes : uniquement les lignes
+        encore conservées et, si le filtre les déclare, les colonnes dont il a besoin.
+        Le filtre voit les mêmes colonnes qu'en exécution séquentielle.
+        """
+        available = list(base.columns) if columns is None else columns
+        required = data_filter.get_required_columns()
+
+        if positions is None and (columns is None or (required is not None and set(required) <= set(columns))):
+            return base
+
+        if required is not None:
+            # Une colonne absente est omise : le filtre lève alors sa propre KeyError
+            view_columns = [col for col in required if col in available]
+        else:
+            view_columns = available
+
+        rows = slice(None) if positions is None else positions
+        return base.iloc[rows, base.columns.get_indexer(view_columns)]
+
+    def _record(
+        self,
+        data_filter: DataFilter,
+        started: float,
+        rows_in: int,
+        rows_out: int,
+        is_row_filter: bool = False
+    ) -> None:
+        """Enregistre une exécution dans les statistiques du filtre."""
+        statistics = self._statistics.get(data_filter)
+        if statistics is None:
+            statistics = self._statistics[data_filter] = FilterStatistics(str(data_filter.describe()))
+        statistics.is_row_filter = statistics.is_row_filter or is_row_filter
+        statistics.record(time.perf_counter() - started, rows_in, rows_out)
+
+    @staticmethod
+    def _materialize(df: pd.DataFrame, positions: Optional[np.ndarray], columns: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Construit le résultat en une seule extraction (lignes et colonnes).
+
+        Returns:
+            DataFrame: Une copie ne contenant que les lignes et colonnes retenues.
+        """
+        if positions is None and columns is None:
+            return df.copy()
+
+        rows = slice(None) if positions is None else positions
+        cols = slice(None) if columns is None else df.columns.get_indexer(columns)
+        # L'extraction produit déjà de nouveaux tableaux : la copie superficielle
+        # sert seulement à détacher le résultat de df (pas de SettingWithCopyWarning)
+        return df.iloc[rows, cols].copy(deep=False)
+
+    def get_statistics(self) -> pd.DataFrame:
+        """
+        Retourne les statistiques d'exécution de chaque filtre (mode compilé),
+        triées du filtre le plus coûteux au moins coûteux.
+
+        Returns:
+            DataFrame: Une ligne par filtre (appels, temps, lignes, sélectivité,
+                       part du temps total).
+        """
+        rows = [statistics.to_dict() for statistics in self._statistics.values()]
+        report = pd.DataFrame(rows, columns=[
+            "filter", "calls", "total_seconds", "mean_seconds", "rows_in", "rows_out", "selectivity"
+        ])
+        total = report["total_seconds"].sum()
+        report["share_of_time"] = report["total_seconds"] / total if total else 0.0
+        return report.sort_values("total_seconds", ascending=False, ignore_index=True)
+
+    def reset_statistics(self) -> None:
+        """Oublie les statistiques mesurées (l'ordre d'origine est alors rétabli)."""
+        self._statistics.clear()
+
+    def _get_filters(self) -> List[DataFilter]:
+        """
+        Retourne les filtres de la file dans l'ordre, sans modifier la file.
+
+        Returns:
+            List[DataFilter]: Les filtres du composite.
+        """
+        return list(self._filter_queue)
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Décrit le composite par la liste ordonnée des descriptions de ses filtres.
+
+        Returns:
+            Dict[str, Any]: La description canonique du pipeline.
+        """
+        return {"type": type(self).__name__, "filters": [f.describe() for f in self._get_filters()]}
+
+    def get_server_predicates(self) -> Optional[List[ColumnPredicate]]:
+        """
+        Rassemble les prédicats des filtres délégables. Les filtres étant combinés
+        par un ET logique, n'en déléguer qu'une partie reste correct : les autres
+        sont appliqués localement.
+
+        Returns:
+            Optional[List[ColumnPredicate]]: Les prédicats, ou None si aucun filtre n'est délégable.
+        """
+        predicates = []
+        for data_filter in self._get_filters():
+            predicates.extend(data_filter.get_server_predicates() or [])
+        return predicates or None
 
     def is_empty(self) -> bool:
         """
@@ -93,6 +308,7 @@ class CompositeFilter(DataFilter):
         Vide tous les filtres de la file.
         """
         self._filter_queue.clear()
+        self._statistics.clear()
 
     def __str__(self) -> str:
         """
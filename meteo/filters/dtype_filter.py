@@ -0,0 +1,86 @@
+"""Filtre optimisant les types des colonnes d'un DataFrame pour réduire sa mémoire."""
+import pandas as pd
+from typing import Dict, List, Optional
+from ..interfaces.base_interfaces import DataFilter
+
+
+class DtypeFilter(DataFilter):
+    """
+    Convertit les colonnes vers des types plus compacts, sans modifier les lignes :
+    - colonnes textuelles très répétées -> `category` ;
+    - horodatages textuels -> `datetime64` (parsés en UTC puis convertis dans le fuseau voulu) ;
+    - mesures `float64` -> `float32`.
+
+    Les colonnes absentes du DataFrame sont ignorées. Si report_memory est actif,
+    l'empreinte mémoire (`memory_usage(deep=True)`, coûteuse sur les colonnes
+    texte) est mesurée avant et après la conversion.
+    """
+
+    def __init__(
+        self,
+        category_columns: Optional[List[str]] = None,
+        datetime_columns: Optional[List[str]] = None,
+        float32_columns: Optional[List[str]] = None,
+        timezone: str = "Europe/Paris",
+        report_memory: bool = False
+    ):
+        """
+        Initialise le filtre avec les colonnes à convertir.
+
+        Args:
+            category_columns (Optional[List[str]]): Colonnes converties en `category`.
+            datetime_columns (Optional[List[str]]): Colonnes d'horodatages à parser.
+            float32_columns (Optional[List[str]]): Colonnes numériques réduites en `float32`.
+            timezone (str): Fuseau horaire des horodatages parsés.
+            report_memory (bool): Mesure et affiche l'empreinte mémoire avant/après
+                                  chaque conversion (désactivé : aucune mesure).
+        """
+        self.category_columns = list(category_columns or [])
+        self.datetime_columns = list(datetime_columns or [])
+        self.float32_columns = list(float32_columns or [])
+        self.timezone = timezone
+        self._report_memory = report_memory
+        self._last_report: Optional[Dict[str, int]] = None
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Retourne une copie du DataFrame aux types optimisés.
+
+        Args:
+            df (DataFrame): Le DataFrame à convertir.
+
+        Returns:
+            DataFrame: Un nouveau DataFrame, de mêmes lignes et colonnes.
+        """
+        before = int(df.memory_usage(deep=True).sum()) if self._report_memory else None
+        result = df.copy()
+
+        for column in self.category_columns:
+            if column in result.columns and not isinstance(result[column].dtype, pd.CategoricalDtype):
+                result[column] = result[column].astype("category")
+
+        for column in self.datetime_columns:
+            if column in result.columns and not pd.api.types.is_datetime64_any_dtype(result[column]):
+                result[column] = pd.to_datetime(result[column], utc=True).dt.tz_convert(self.timezone)
+
+        for column in self.float32_columns:
+            if column in result.columns:
+                result[column] = pd.to_numeric(result[column], errors="coerce").astype("float32")
+
+        if self._report_memory:
+            after = int(result.memory_usage(deep=True).sum())
+            self._last_report = {"before_bytes": before, "after_bytes": after, "saved_bytes": before - after}
+            print(f"[MÉMOIRE] {len(result)} lignes : {before / 1024:.1f} Ko -> {after / 1024:.1f} Ko")
+
+        return result
+
+    def get_memory_report(self) -> Optional[Dict[str, int]]:
+        """
+        Retourne l'empreinte mémoire mesurée lors de la dernière conversion.
+
+        Returns:
+            Optional[Dict[str, int]]: Octets avant, après et économisés,
+                                      ou None si aucune conversion n'a été
+                                      mesurée (report_memory désactivé).
+        """
+        return None if self._last_report is None else dict(self._last_report)
@@ -1,5 +1,10 @@
+import json
+import weakref
 import pandas as pd
+from typing import Dict, Any, Hashable, List, Optional
 from ..interfaces.base_interfaces import DataFilter
+from ..models.column_predicate import ColumnPredicate
+from ..storage.dataframe_cache import DataFrameCache
 
 class FilterDecorator(DataFilter):
     """
@@ -14,6 +19,18 @@ class FilterDecorator(DataFilter):
         """Délègue l'appel au composant décoré."""
         return self._wrapped_filter.filter(df)
 
+    def describe(self) -> Dict[str, Any]:
+        """Un décorateur ne modifie pas le résultat : il reprend la description du filtre décoré."""
+        return self._wrapped_filter.describe()
+
+    def get_projection(self) -> Optional[List[str]]:
+        """Délègue la projection au composant décoré."""
+        return self._wrapped_filter.get_projection()
+
+    def get_server_predicates(self) -> Optional[List[ColumnPredicate]]:
+        """Délègue les prédicats au composant décoré."""
+        return self._wrapped_filter.get_server_predicates()
+
 
 class LoggingDecorator(FilterDecorator):
     """
@@ -29,3 +46,65 @@ class LoggingDecorator(FilterDecorator):
         
         print(f"[LOG] Lignes après : {len(result)}")
         return result
+
+
+class MemoizingDecorator(FilterDecorator):
+    """
+    Décorateur qui mémorise les résultats du filtre enveloppé.
+
+    La clé combine l'identité du DataFrame d'entrée (objet, forme et colonnes)
+    et la description canonique du filtre : un même filtrage sur le même
+    DataFrame devient un accès au cache, sans relire ses valeurs. Comme pour
+    l'index du catalogue, le DataFrame d'entrée est considéré comme immuable ;
+    ses résultats sont retirés du cache dès qu'il est libéré.
+    """
+    def __init__(
+        self,
+        wrapped_filter: DataFilter,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: Optional[int] = 128,
+        cache: Optional[DataFrameCache] = None
+    ):
+        """
+        Initialise le décorateur.
+
+        Args:
+            wrapped_filter (DataFilter): Le filtre à mémoriser.
+            max_bytes (int): Budget mémoire des résultats conservés.
+            max_entries (Optional[int]): Nombre maximal de résultats conservés.
+            cache (Optional[DataFrameCache]): Cache à partager entre plusieurs
+                                              décorateurs (prioritaire sur les limites).
+        """
+        super().__init__(wrapped_filter)
+        self._cache = cache if cache is not None else DataFrameCache(max_bytes=max_bytes, max_entries=max_entries)
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        key = (self.fingerprint(df), json.dumps(self.describe(), sort_keys=True, default=str))
+
+        cached = self._cache.get(key)
+        if cached is None:
+            cached = super().filter(df)
+            if self._cache.put(key, cached):
+                # L'identité d'un DataFrame libéré peut être réattribuée : son résultat est oublié
+                weakref.finalize(df, self._cache.invalidate, key)
+
+        # Copie : l'appelant peut modifier le résultat sans altérer le cache
+        return cached.copy()
+
+    @staticmethod
+    def fingerprint(df: pd.DataFrame) -> Hashable:
+        """
+        Calcule une empreinte d'un DataFrame, en temps constant.
+
+        Args:
+            df (DataFrame): Le DataFrame à identifier.
+
+        Returns:
+            Hashable: Une empreinte identique tant que le même objet est vivant et
+                      conserve sa forme et ses colonnes.
+        """
+        return (id(df), df.shape, tuple(df.columns))
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques du cache (succès, échecs, entrées, octets)."""
+        return self._cache.get_stats()
@@ -0,0 +1,90 @@
+"""Statistiques d'exécution d'un filtre au sein d'un pipeline."""
+from typing import Any, Dict
+
+
+class FilterStatistics:
+    """
+    Accumule le coût (temps passé) et la sélectivité (part des lignes conservées)
+    d'un filtre au fil des exécutions d'un pipeline.
+    """
+
+    def __init__(self, name: str):
+        """
+        Initialise des statistiques vides.
+
+        Args:
+            name (str): Le nom affiché du filtre.
+        """
+        self.name = name
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.rows_in = 0
+        self.rows_out = 0
+        # True dès que le filtre a fourni un masque de lignes
+        self.is_row_filter = False
+
+    def record(self, seconds: float, rows_in: int, rows_out: int) -> None:
+        """
+        Enregistre une exécution du filtre.
+
+        Args:
+            seconds (float): La durée de l'exécution.
+            rows_in (int): Le nombre de lignes évaluées.
+            rows_out (int): Le nombre de lignes conservées.
+        """
+        self.calls += 1
+        self.total_seconds += seconds
+        self.rows_in += rows_in
+        self.rows_out += rows_out
+
+    @property
+    def selectivity(self) -> float:
+        """Part des lignes conservées (1.0 si le filtre n'a encore rien évalué)."""
+        if self.rows_in == 0:
+            return 1.0
+        return self.rows_out / self.rows_in
+
+    @property
+    def cost_per_row(self) -> float:
+        """Temps moyen passé par ligne évaluée."""
+        if self.rows_in == 0:
+            return 0.0
+        return self.total_seconds / self.rows_in
+
+    @property
+    def rank(self) -> float:
+        """
+        Rang d'exécution d'un filtre de lignes : coût par ligne rapporté à la part
+        de lignes éliminées. Les filtres de plus petit rang (peu coûteux et très
+        sélectifs) doivent passer en premier.
+        """
+        rejected = 1.0 - self.selectivity
+        if rejected <= 0:
+            return float("inf")
+        return self.cost_per_row / rejected
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques sous forme de dictionnaire.
+
+        Returns:
+            Dict[str, Any]: Nom, appels, temps total et moyen, lignes, sélectivité.
+        """
+        return {
+            "filter": self.name,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "selectivity": self.selectivity
+        }
+
+    def __repr__(self) -> str:
+        """
+        Retourne la représentation de l'objet FilterStatistics.
+        """
+        return (
+            f"FilterStatistics(name='{self.name}', calls={self.calls}, "
+            f"total_seconds={self.total_seconds:.6f}, selectivity={self.selectivity:.3f})"
+        )
@@ -1,7 +1,8 @@
 """Filtre pour inclure/exclure des lignes basées sur des mots-clés dans une colonne."""
 import pandas as pd
-from typing import Optional
+from typing import Optional, List
 from ..interfaces.base_interfaces import DataFilter
+from ..models.column_predicate import ColumnPredicate
 
 
 class KeywordFilter(DataFilter):
@@ -24,16 +25,37 @@ class KeywordFilter(DataFilter):
         self.include_keyword = include_keyword
         self.exclude_keyword = exclude_keyword
 
-    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+    def get_server_predicates(self) -> Optional[List[ColumnPredicate]]:
         """
-        Applique le filtre sur le DataFrame.
-pip
+        Traduit les mots-clés d'inclusion et d'exclusion en prédicats.
+
+        Returns:
+            Optional[List[ColumnPredicate]]: Les prédicats équivalents au filtre.
+        """
+        predicates = [ColumnPredicate(self.column_name, self.include_keyword)]
+        if self.exclude_keyword:
+            predicates.append(ColumnPredicate(self.column_name, self.exclude_keyword, negate=True))
+        return predicates
+
+    def get_required_columns(self) -> Optional[List[str]]:
+        """
+        Retourne la colonne lue par le filtre.
+
+        Returns:
+            Optional[List[str]]: La colonne filtrée.
+        """
+        return [self.column_name]
+
+    def build_mask(self, df: pd.DataFrame) -> pd.Series:
+        """
+        Calcule le masque booléen des lignes conservées par le filtre.
+
         Args:
-            df (DataFrame): Le DataFrame à filtrer.
+            df (DataFrame): Le DataFrame à évaluer.
 
         Returns:
-            DataFrame: Un nouveau DataFrame contenant les lignes filtrées.
-            
+            Series: True pour chaque ligne à conserver.
+
         Raises:
             KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
         """
@@ -50,8 +72,21 @@ pip
             exclude_condition = ~df[self.column_name].str.contains(
                 self.exclude_keyword, case=False, na=False
             )
-            final_condition = include_condition & exclude_condition
-        else:
-            final_condition = include_condition
-        
-        return df[final_condition].copy()
\ No newline at end of file
+            return include_condition & exclude_condition
+
+        return include_condition
+
+    def filter(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Applique le filtre sur le DataFrame.
+
+        Args:
+            df (DataFrame): Le DataFrame à filtrer.
+
+        Returns:
+            DataFrame: Un nouveau DataFrame contenant les lignes filtrées.
+            
+        Raises:
+            KeyError: Si la colonne spécifiée n'existe pas dans le DataFrame.
+        """
+        return df[self.build_mask(df)].copy()
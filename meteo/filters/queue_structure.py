@@ -1,5 +1,6 @@
 """ Implémentation personnalisée d'une structure de données Queue (File FIFO). """
-from typing import List, Any, Optional
+from collections import deque
+from typing import Any, Iterator, Optional
 
 
 class Queue:
@@ -11,12 +12,12 @@ class Queue:
         """
         Initialise une file vide.
 
-        La file est implémentée avec une liste Python où:
+        La file est implémentée avec une `deque` où:
         - Les éléments sont ajoutés à la FIN (append)
-        - Les éléments sont retirés au DÉBUT (pop(0))
+        - Les éléments sont retirés au DÉBUT (popleft, en O(1))
         """
 
-        self._items: List[Any] = []
+        self._items: deque = deque()
 
     def enqueue(self, item: Any) -> None:
         """
@@ -49,7 +50,7 @@ class Queue:
         if self.is_empty():
             raise IndexError("Impossible de retirer un élément d'une file vide")
 
-        return self._items.pop(0)
+        return self._items.popleft()
 
     def peek(self) -> Optional[Any]:
         """
@@ -84,7 +85,7 @@ class Queue:
         """
         Vide complètement la file.
         """
-        self._items = []
+        self._items.clear()
 
     def __str__(self) -> str:
         """
@@ -93,7 +94,16 @@ class Queue:
         Returns:
             str: La file sous forme de chaîne.
         """
-        return f"Queue({self._items})"
+        return f"Queue({list(self._items)})"
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Parcourt les éléments du premier au dernier sans les retirer de la file.
+
+        Returns:
+            Iterator: Un itérateur sur les éléments.
+        """
+        return iter(self._items)
 
     def __len__(self) -> int:
         """
@@ -1,28 +1,63 @@
 """ Ce module définit des classes de base servant d'interfaces """
-from typing import List
+from typing import List, Optional, Dict, Any, Iterator
 import pandas as pd
+from ..models.column_predicate import ColumnPredicate
 
 class DataLoader:
     """ Classe de base pour une classe chargée de charger des données. """
+
+    # True si load_data / get_source_version acceptent un argument `predicates`
+    # (liste de ColumnPredicate) appliqué côté source
+    supports_predicates = False
+
     def load_data(self) -> pd.DataFrame:
 
         raise NotImplementedError("Cette méthode doit être implémentée par la sous-classe")
 
+    def get_source_version(self) -> Optional[str]:
+        """
+        Retourne un identifiant de la version actuelle de la source (ex : ETag).
+
+        Returns:
+            Optional[str]: L'identifiant de version, ou None s'il est inconnu.
+        """
+        return None
+
 
 class ParameterizedDataLoader:
     """ Classe de base pour les loaders nécessitant un identifiant. """
-    def load_data(self, identifier: str) -> pd.DataFrame:
+
+    # True si load_data / iter_data acceptent un argument `columns` transmis à la source
+    supports_projection = False
+
+    def load_data(self, identifier: str, raise_errors: bool = False) -> pd.DataFrame:
         """
         Charge des données pour un identifiant spécifique.
 
         Args:
             identifier (str): L'identifiant de la ressource à charger.
+            raise_errors (bool): Si True, une source injoignable lève une exception
+                                 au lieu de produire un résultat vide.
 
         Returns:
             pd.DataFrame: Les données chargées.
         """
         raise NotImplementedError("Cette méthode doit être implémentée par la sous-classe")
 
+    def iter_data(self, identifier: str, since: Optional[Any] = None, until: Optional[Any] = None) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt l'ensemble des données d'un identifiant, bloc par bloc.
+
+        Args:
+            identifier (str): L'identifiant de la ressource à charger.
+            since (Optional[Any]): Début de la période (inclus).
+            until (Optional[Any]): Fin de la période (incluse).
+
+        Returns:
+            Iterator[pd.DataFrame]: Un générateur de blocs de données.
+        """
+        raise NotImplementedError("Cette méthode doit être implémentée par la sous-classe")
+
 
 class DataFilter:
     """ Classe de base pour une classe chargée de filtrer des données. """
@@ -37,6 +72,59 @@ class DataFilter:
         """
         raise NotImplementedError("Cette méthode doit être implémentée par la sous-classe")
 
+    def build_mask(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        """
+        Calcule le masque booléen des lignes conservées, si le filtre se résume
+        à une sélection de lignes. Un composite peut ainsi combiner les masques
+        de plusieurs filtres et ne matérialiser le résultat qu'une seule fois.
+
+        Args:
+            - df (dataframe): Le DataFrame à évaluer.
+
+        Returns: Le masque (aligné sur l'index de df), ou None si le filtre
+                 n'est pas une simple sélection de lignes.
+        """
+        return None
+
+    def get_required_columns(self) -> Optional[List[str]]:
+        """
+        Retourne les colonnes lues par le filtre pour calculer son masque.
+        Un composite peut alors ne lui transmettre que ces colonnes.
+
+        Returns: La liste des colonnes, ou None si elle est inconnue.
+        """
+        return None
+
+    def get_projection(self) -> Optional[List[str]]:
+        """
+        Retourne les colonnes conservées par le filtre, si celui-ci se résume
+        à une projection pouvant être déléguée à la source de données.
+
+        Returns: La liste des colonnes, ou None si le filtre n'est pas une projection.
+        """
+        return None
+
+    def get_server_predicates(self) -> Optional[List[ColumnPredicate]]:
+        """
+        Décrit le filtre sous forme de prédicats (combinés par un ET logique)
+        pouvant être appliqués par la source de données.
+        Le filtre reste appliqué localement : les prédicats ne font que réduire
+        le volume transféré.
+
+        Returns: La liste des prédicats, ou None si le filtre ne peut pas être délégué.
+        """
+        return None
+
+    def describe(self) -> Dict[str, Any]:
+        """
+        Retourne une description canonique du filtre (type et paramètres publics).
+        Deux filtres de même description produisent le même résultat.
+
+        Returns: Un dictionnaire sérialisable en JSON.
+        """
+        params = {key: value for key, value in vars(self).items() if not key.startswith("_")}
+        return {"type": type(self).__name__, "params": params}
+
 
 class UserInterface:
     """ Classe de base pour une classe gérant l'interaction avec l'utilisateur. """
@@ -57,6 +57,72 @@ class StationNavigator:
         """
         raise NotImplementedError("Cette méthode doit être implémentée par la sous-classe")
 
+    def seek(self, index: int):
+        """
+        Positionne la navigation sur la station d'index donné (commence à 0).
+        Implémentation par défaut en O(n) ; les sous-classes indexées la redéfinissent.
+
+        Returns :
+            Station : La station désormais courante.
+
+        Raises :
+            IndexError : Si la position est hors limites.
+        """
+        if not 0 <= index < self.get_total():
+            raise IndexError(f"Position de station invalide : {index}")
+
+        self.reset()
+        for _ in range(index):
+            self.next()
+        return self.get_current()
+
+    def seek_to(self, station_id: str):
+        """
+        Positionne la navigation sur la station d'identifiant donné.
+        Implémentation par défaut en O(n) ; les sous-classes indexées la redéfinissent.
+
+        Returns :
+            Station : La station désormais courante, ou None si l'identifiant est inconnu
+                      (la position est alors inchangée).
+        """
+        origin = self.get_position() - 1
+        self.reset()
+        for index in range(self.get_total()):
+            current = self.get_current()
+            if current is not None and current.dataset_id == station_id:
+                return current
+            if index + 1 < self.get_total():
+                self.next()
+
+        if origin >= 0:
+            self.seek(origin)
+        return None
+
+    def peek(self, offset: int):
+        """
+        Retourne la station située à `offset` positions de la station courante,
+        sans changer la position.
+        Implémentation par défaut : déplacement pas à pas puis retour à la
+        position d'origine ; les sous-classes indexées la redéfinissent.
+
+        Returns :
+            Station : La station, ou None si la position est hors limites.
+        """
+        forward = offset > 0
+        station = self.get_current()
+        moved = 0
+        while moved < abs(offset) and (self.has_next() if forward else self.has_previous()):
+            station = self.next() if forward else self.previous()
+            moved += 1
+
+        for _ in range(moved):
+            if forward:
+                self.previous()
+            else:
+                self.next()
+
+        return station if moved == abs(offset) else None
+
     def get_position(self) -> int:
         """
         Retourne la position actuelle (1-indexed).
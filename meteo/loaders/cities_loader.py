@@ -1,8 +1,13 @@
 """Loader pour le catalogue des villes depuis une URL."""
+import json
+import re
 import requests
 import pandas as pd
-from io import StringIO
-from ..interfaces.base_interfaces import DataLoader
+from typing import Dict, List, Optional
+from ..interfaces.base_interfaces import DataFilter, DataLoader
+from ..models.column_predicate import ColumnPredicate
+from ..storage.http_cache import HttpResponseCache
+from .http_client import HttpClient
 
 
 
@@ -12,33 +17,256 @@ class CitiesLoader(DataLoader):
     Charge le catalogue des villes depuis une URL fournissant un fichier CSV.
     """
 
-    def __init__(self, catalog_url: str):
+    # Les prédicats des filtres peuvent être traduits en clause `where` de l'export
+    supports_predicates = True
+
+    # Mots-clés délégables : minuscules, chiffres et tirets, sans joker ODSQL
+    SERVER_KEYWORD_PATTERN = re.compile(r"[a-z0-9-]+")
+
+    def __init__(
+        self,
+        catalog_url: str,
+        http_client: Optional[HttpClient] = None,
+        response_cache: Optional[HttpResponseCache] = None,
+        server_fields: Optional[Dict[str, str]] = None,
+        columns: Optional[List[str]] = None,
+        chunk_filter: Optional[DataFilter] = None,
+        chunk_size: int = 5000
+    ):
         """
         Initialise le loader avec l'URL du catalogue.
 
         Args:
             catalog_url (str): L'URL directe vers le fichier CSV des villes.
+            http_client (Optional[HttpClient]): Client HTTP partagé. Un client
+                                                dédié est créé s'il est absent.
+            response_cache (Optional[HttpResponseCache]): Cache disque des réponses.
+                Si fourni, le catalogue est revalidé par requête conditionnelle.
+            server_fields (Optional[Dict[str, str]]): Correspondance entre les colonnes
+                du CSV et les champs ODSQL de l'API. Seuls les prédicats portant sur
+                ces colonnes sont appliqués côté serveur. Ces champs doivent contenir
+                des identifiants en minuscules (comme `dataset_id`) : voir
+                _build_where_clause().
+            columns (Optional[List[str]]): Colonnes du CSV à conserver, les autres étant
+                écartées dès le parsing. Toutes les colonnes sont lues si None.
+            chunk_filter (Optional[DataFilter]): Filtre appliqué à chaque bloc du CSV
+                pendant le parsing (ex: KeywordFilter) : seules les lignes conservées
+                s'accumulent en mémoire.
+            chunk_size (int): Nombre de lignes parsées par bloc.
         """
         self.catalog_url = catalog_url
+        self.http_client = http_client or HttpClient()
+        self.response_cache = response_cache
+        self.server_fields = server_fields or {}
+        self.columns = list(columns) if columns is not None else None
+        self.chunk_filter = chunk_filter
+        self.chunk_size = chunk_size
+        # Corps tout juste revalidés par get_source_version(), consommés par load_data()
+        self._revalidated_paths: Dict[str, str] = {}
 
-    def load_data(self) -> pd.DataFrame:
+    def load_data(self, predicates: Optional[List[ColumnPredicate]] = None) -> pd.DataFrame:
         """
         Charge les données depuis l'URL, les parse en CSV et les retourne en DataFrame.
 
+        Args:
+            predicates (Optional[List[ColumnPredicate]]): Prédicats à appliquer côté
+                serveur. Si l'API les refuse ou ne renvoie rien, le catalogue complet
+                est chargé (les filtres locaux restent de toute façon appliqués).
+
         Returns:
             DataFrame: Un DataFrame contenant les données des villes.
 
         """
+        url = self._build_url(predicates)
+
         try:
-            # Réponse de la request
-            response = requests.get(self.catalog_url)
-            
+            df = self._read_catalog(url)
+            if df.empty and url != self.catalog_url:
+                return self.load_data()
+            return df
+
+        except requests.exceptions.HTTPError as e:
+            if url != self.catalog_url and e.response is not None and e.response.status_code == 400:
+                # Clause `where` refusée par l'API : repli sur l'export complet
+                return self.load_data()
+            print(f"Erreur de connexion à l'API : {e}")
+
+        except requests.exceptions.RequestException as e:
+            print(f"Erreur de connexion à l'API : {e}")
+
+    def _read_catalog(self, url: str) -> pd.DataFrame:
+        """
+        Télécharge et parse l'export CSV d'une URL, par blocs.
+
+        Raises:
+            RequestException: Si la requête échoue.
+        """
+        if self.response_cache is not None:
+            # Lecture depuis le disque après revalidation (304 ou nouveau corps)
+            body_path = self._revalidated_paths.pop(url, None) or self._fetch_to_cache(url)
+            return self._parse_csv(body_path)
+
+        # Réponse de la request, lue au fil de l'eau
+        response = self.http_client.get(url, stream=True)
+
+        with response:
             # Vérifie si la requête a réussi
             response.raise_for_status()
 
-            # Lecture du CSV depuis le texte de la réponse
-            df = pd.read_csv(StringIO(response.text), sep=";")
-            return df
+            # Décompression gzip éventuelle à la volée, le BOM est retiré par l'encodage
+            response.raw.decode_content = True
+            return self._parse_csv(response.raw)
+
+    def _parse_csv(self, source) -> pd.DataFrame:
+        """
+        Parse le CSV par blocs de chunk_size lignes, en filtrant chaque bloc
+        avant de l'accumuler.
+
+        Args:
+            source: Chemin du fichier ou flux binaire de la réponse.
+
+        Returns:
+            DataFrame: Les lignes conservées.
+        """
+        reader = pd.read_csv(
+            source,
+            sep=";",
+            encoding="utf-8-sig",
+            usecols=self._get_usecols(),
+            chunksize=self.chunk_size
+        )
+
+        chunks = []
+        # Résultat vide conservant les colonnes du CSV, si aucune ligne ne subsiste
+        empty = pd.DataFrame()
+        with reader:
+            for chunk in reader:
+                if self.chunk_filter is not None:
+                    chunk = self.chunk_filter.filter(chunk)
+                if chunk.empty:
+                    empty = chunk
+                else:
+                    chunks.append(chunk)
+
+        if not chunks:
+            return empty
+        return pd.concat(chunks, ignore_index=True)
+
+    def _get_usecols(self):
+        """
+        Retourne le sélecteur de colonnes passé à read_csv. Une colonne configurée
+        mais absente de l'export est simplement ignorée.
+        """
+        if self.columns is None:
+            return None
+        columns = set(self.columns)
+        return lambda column: column in columns
+
+    def get_source_version(self, predicates: Optional[List[ColumnPredicate]] = None) -> Optional[str]:
+        """
+        Revalide le catalogue et retourne l'identifiant de sa version (ETag ou
+        Last-Modified) associé à l'URL interrogée.
+        Le corps revalidé est réutilisé par le prochain appel à load_data().
+
+        Args:
+            predicates (Optional[List[ColumnPredicate]]): Prédicats appliqués côté serveur.
+
+        Returns:
+            Optional[str]: La version, ou None si aucun cache n'est configuré,
+                           si l'API ne fournit pas de validateur ou si elle est injoignable.
+        """
+        if self.response_cache is None:
+            return None
+
+        url = self._build_url(predicates)
+        try:
+            self._revalidated_paths[url] = self._fetch_to_cache(url)
+        except requests.exceptions.RequestException:
+            return None
+
+        validator = self.response_cache.get_validator(url)
+        if validator is None:
+            return None
+        # Les colonnes lues et le filtre des blocs font partie de la version :
+        # un autre choix donne un autre catalogue brut
+        version = f"{url}#{validator}"
+        if self.columns is not None:
+            version += f"#{','.join(self.columns)}"
+        if self.chunk_filter is not None:
+            version += f"#{json.dumps(self.chunk_filter.describe(), sort_keys=True, default=str)}"
+        return version
+
+    def _build_url(self, predicates: Optional[List[ColumnPredicate]]) -> str:
+        """
+        Construit l'URL de l'export, complétée de la clause `where` des prédicats
+        pris en charge par l'API.
+
+        Returns:
+            str: L'URL à interroger.
+        """
+        where_clause = self._build_where_clause(predicates or [])
+        if where_clause is None:
+            return self.catalog_url
+        return requests.Request("GET", self.catalog_url, params={"where": where_clause}).prepare().url
+
+    def _build_where_clause(self, predicates: List[ColumnPredicate]) -> Optional[str]:
+        """
+        Traduit les prédicats en clause ODSQL. Les prédicats portant sur une
+        colonne sans champ serveur connu sont ignorés (ils restent appliqués localement).
+
+        Le filtre local (recherche sans casse) ne peut pas rattraper une ligne que
+        le serveur aurait écartée : seuls sont délégués les prédicats dont le
+        `like` ODSQL donne le même résultat. C'est le cas d'un mot-clé en minuscules,
+        chiffres et tirets (aucun joker, aucune question de casse) appliqué à un
+        champ dont les valeurs sont elles-mêmes en minuscules, comme les
+        identifiants de jeux de données. Les autres prédicats restent locaux.
+
+        Returns:
+            Optional[str]: La clause, ou None si aucun prédicat n'est traduisible.
+        """
+        conditions = []
+        for predicate in predicates:
+            field = self.server_fields.get(predicate.column)
+            if field is None or not self.SERVER_KEYWORD_PATTERN.fullmatch(predicate.keyword):
+                continue
+            condition = f'{field} like "*{predicate.keyword}*"'
+            conditions.append(f"not ({condition})" if predicate.negate else condition)
+
+        return " and ".join(conditions) or None
+
+    def _fetch_to_cache(self, url: str) -> str:
+        """
+        Revalide le catalogue auprès de l'API et retourne le chemin du corps en cache.
+        En cas d'erreur réseau, la dernière version connue est servie si elle existe.
+
+        Args:
+            url (str): L'URL de l'export à revalider.
+
+        Returns:
+            str: Le chemin du fichier CSV à jour sur le disque.
+
+        Raises:
+            RequestException: Si la requête échoue et qu'aucune version n'est en cache.
+        """
+        cached_path = self.response_cache.get_body_path(url)
+
+        try:
+            response = self.http_client.get(
+                url,
+                headers=self.response_cache.get_conditional_headers(url),
+                stream=True
+            )
+
+            with response:
+                # 304 Not Modified : le corps sur disque est toujours valide
+                if response.status_code == 304 and cached_path is not None:
+                    return cached_path
+
+                response.raise_for_status()
+                return self.response_cache.store(url, response)
 
         except requests.exceptions.RequestException as e:
-            print(f"Erreur de connexion à l'API : {e}")
\ No newline at end of file
+            if cached_path is None:
+                raise
+            print(f"Erreur de connexion à l'API, utilisation du catalogue en cache : {e}")
+            return cached_path
@@ -0,0 +1,146 @@
+"""Client HTTP mutualisé (pool de connexions keep-alive) partagé par les loaders."""
+import threading
+import weakref
+import requests
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class HttpClient:
+    """
+    Encapsule une session `requests` configurée avec un pool de connexions
+    persistantes, des timeouts par défaut et une politique de relance.
+
+    Une seule instance est partagée entre tous les loaders : les connexions
+    TCP/TLS déjà établies vers l'API sont ainsi réutilisées d'un appel à l'autre.
+    """
+
+    # Codes HTTP pour lesquels une nouvelle tentative est effectuée
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        session: Optional[requests.Session] = None,
+        max_per_host: Optional[int] = None
+    ):
+        """
+        Initialise le client et sa session.
+
+        Args:
+            pool_size (int): Nombre maximal de connexions conservées par hôte.
+            connect_timeout (float): Délai maximal d'établissement de connexion (s).
+            read_timeout (float): Délai maximal d'attente de la réponse (s).
+            max_retries (int): Nombre de relances sur erreur réseau ou 429/5xx.
+            backoff_factor (float): Facteur d'attente exponentielle entre relances.
+            session (Optional[Session]): Session existante à réutiliser (tests, proxy...).
+            max_per_host (Optional[int]): Nombre maximal de requêtes simultanées vers
+                                          un même hôte (illimité si None).
+        """
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = session or self._create_session(pool_size, max_retries, backoff_factor)
+        self.max_per_host = max_per_host
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_slots_lock = threading.Lock()
+
+    def _create_session(self, pool_size: int, max_retries: int, backoff_factor: float) -> requests.Session:
+        """
+        Construit une session avec un adaptateur poolé et une stratégie de relance.
+
+        Returns:
+            Session: La session configurée.
+        """
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            respect_retry_after_header=True,
+            # On laisse raise_for_status() du loader signaler l'erreur finale
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Négociation de la compression (décompressée de manière transparente par requests)
+        session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Effectue une requête GET via la session partagée.
+        Applique le timeout par défaut si aucun n'est fourni. Si une limite par
+        hôte est configurée, la requête attend qu'une place se libère. La place
+        est rendue dès la réception de la réponse ou, avec stream=True, à la
+        fermeture de la réponse (bloc `with`) : le téléchargement du corps
+        reste compté dans la limite.
+
+        Args:
+            url (str): L'URL à interroger.
+            **kwargs: Arguments supplémentaires transmis à `Session.get`.
+
+        Returns:
+            Response: La réponse HTTP.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if self.max_per_host is None:
+            return self.session.get(url, **kwargs)
+
+        slots = self._get_host_slots(urlsplit(url).netloc)
+        slots.acquire()
+        try:
+            response = self.session.get(url, **kwargs)
+        except BaseException:
+            slots.release()
+            raise
+
+        if not kwargs.get("stream"):
+            # Corps déjà téléchargé
+            slots.release()
+        else:
+            self._release_on_close(response, slots)
+        return response
+
+    @staticmethod
+    def _release_on_close(response: requests.Response, slots: threading.BoundedSemaphore) -> None:
+        """
+        Rend la place d'un hôte à la fermeture d'une réponse lue en flux, ou à
+        sa libération si elle n'a jamais été fermée.
+        """
+        released = threading.Lock()
+
+        def release() -> None:
+            # Une seule restitution, quel que soit le chemin de fermeture
+            if released.acquire(blocking=False):
+                slots.release()
+
+        close = response.close
+
+        def close_and_release() -> None:
+            try:
+                close()
+            finally:
+                release()
+
+        response.close = close_and_release
+        weakref.finalize(response, release)
+
+    def _get_host_slots(self, host: str) -> threading.BoundedSemaphore:
+        """Retourne le sémaphore limitant les requêtes simultanées vers un hôte."""
+        with self._host_slots_lock:
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = self._host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            return slots
+
+    def close(self) -> None:
+        """Ferme la session et libère les connexions du pool."""
+        self.session.close()
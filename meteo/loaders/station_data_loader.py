@@ -1,8 +1,9 @@
 """Loader pour les données de stations météo spécifiques."""
 import requests
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Iterator, List
 from ..interfaces.base_interfaces import ParameterizedDataLoader
+from .http_client import HttpClient
 
 
 class StationDataLoader(ParameterizedDataLoader):
@@ -11,34 +12,76 @@ class StationDataLoader(ParameterizedDataLoader):
     un modèle d'URL.
     """
 
-    def __init__(self, api_url_template: str):
+    # Cette implémentation sait transmettre une projection de colonnes à l'API
+    supports_projection = True
+
+    # Taille de page maximale acceptée par l'endpoint /records
+    MAX_PAGE_SIZE = 100
+    # Au-delà de cette fenêtre (offset + limit), l'API refuse la pagination :
+    # l'endpoint d'export doit alors être utilisé
+    MAX_RECORDS_WINDOW = 10000
+
+    def __init__(
+        self,
+        api_url_template: str,
+        http_client: Optional[HttpClient] = None,
+        export_url_template: Optional[str] = None,
+        timestamp_field: str = "heure_de_paris",
+        export_chunk_size: int = 10000
+    ):
         """
         Initialise le loader avec un modèle d'URL.
 
         Args:
-            api_url_template (str): 
+            api_url_template (str):
                 Un modèle d'URL formatable qui doit contenir {station_id}.
                 Ex: "https://.../datasets/{station_id}/records"
+            http_client (Optional[HttpClient]): Client HTTP partagé. Un client
+                                                dédié est créé s'il est absent.
+            export_url_template (Optional[str]): Modèle d'URL de l'export CSV, utilisé
+                pour les historiques trop longs pour être paginés. Par défaut, il est
+                déduit du modèle /records.
+            timestamp_field (str): Le champ horodaté utilisé pour filtrer par période.
+            export_chunk_size (int): Nombre de lignes par bloc lors de la lecture d'un export.
         """
         self.api_url_template = api_url_template
+        self.http_client = http_client or HttpClient()
+        self.export_url_template = export_url_template or api_url_template.replace("/records", "/exports/csv")
+        self.timestamp_field = timestamp_field
+        self.export_chunk_size = export_chunk_size
 
 
-    def load_data(self, station_id: str) -> pd.DataFrame:
+    def load_data(
+        self,
+        station_id: str,
+        columns: Optional[List[str]] = None,
+        raise_errors: bool = False
+    ) -> pd.DataFrame:
         """
         Charge les données pour une station météo donnée.
 
         Args:
             station_id (str): ID de la station à charger.
+            columns (Optional[List[str]]): Colonnes à demander à l'API (paramètre
+                `select`). Si l'une d'elles est refusée, toutes les colonnes sont chargées.
+            raise_errors (bool): Si True, une erreur de l'API est propagée au lieu
+                                 de produire un DataFrame vide.
 
         Returns:
             DataFrame: Un DataFrame contenant les enregistrements de la station.
+
+        Raises:
+            RequestException: Avec raise_errors, si l'API est injoignable ou répond en erreur.
         """
         url = self.api_url_template.format(station_id=station_id)
-        
+
         try:
-            response = requests.get(url)
+            response = self.http_client.get(url, params=self._build_select_params(columns))
+            if columns and response.status_code == 400:
+                # Une colonne projetée n'existe pas pour cette station : pas de projection
+                return self.load_data(station_id, raise_errors=raise_errors)
             response.raise_for_status()
-            
+
             data = response.json()
 
             records: list[Dict[str, Any]] = data.get('results', [])
@@ -51,5 +94,121 @@ class StationDataLoader(ParameterizedDataLoader):
 
 
         except requests.exceptions.RequestException:
+            if raise_errors:
+                raise
             # Retourne un DataFrame vide en cas d'erreur (station inexistante, 400, etc.)
-            return pd.DataFrame()
\ No newline at end of file
+            return pd.DataFrame()
+
+    def iter_data(
+        self,
+        station_id: str,
+        since: Optional[Any] = None,
+        until: Optional[Any] = None,
+        columns: Optional[List[str]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt tout l'historique d'une station, bloc par bloc.
+
+        Les pages de l'endpoint /records sont parcourues via limit/offset. Si
+        l'historique dépasse la fenêtre de pagination de l'API, l'export CSV est
+        lu en flux et découpé en blocs : la mémoire reste bornée quelle que soit
+        la durée demandée.
+
+        Args:
+            station_id (str): ID de la station à charger.
+            since (Optional[Any]): Début de période inclus (str, datetime ou Timestamp).
+            until (Optional[Any]): Fin de période incluse (str, datetime ou Timestamp).
+            columns (Optional[List[str]]): Colonnes à demander à l'API (paramètre
+                `select`). Si l'une d'elles est refusée, toutes les colonnes sont chargées.
+
+        Yields:
+            DataFrame: Les enregistrements, un bloc à la fois.
+
+        Raises:
+            RequestException: Si l'API est injoignable ou répond en erreur
+                              (contrairement à load_data, un historique partiel
+                              n'est jamais renvoyé silencieusement).
+        """
+        params: Dict[str, Any] = self._build_select_params(columns)
+        where_clause = self._build_period_clause(since, until)
+        if where_clause:
+            params["where"] = where_clause
+
+        url = self.api_url_template.format(station_id=station_id)
+        try:
+            first_page = self._get_page(url, params, offset=0)
+        except requests.exceptions.HTTPError as e:
+            if not columns or e.response is None or e.response.status_code != 400:
+                raise
+            # Une colonne projetée n'existe pas pour cette station : pas de projection
+            yield from self.iter_data(station_id, since=since, until=until)
+            return
+        total_count = first_page.get("total_count", 0)
+
+        if total_count > self.MAX_RECORDS_WINDOW:
+            yield from self._iter_export(station_id, params)
+            return
+
+        records = first_page.get("results", [])
+        offset = 0
+        while records:
+            yield pd.DataFrame(records)
+            offset += len(records)
+            if offset >= total_count:
+                break
+            records = self._get_page(url, params, offset=offset).get("results", [])
+
+    def _get_page(self, url: str, params: Dict[str, Any], offset: int) -> Dict[str, Any]:
+        """
+        Récupère une page de l'endpoint /records.
+
+        Returns:
+            Dict[str, Any]: Le JSON de la réponse (total_count, results).
+        """
+        page_params = dict(params, limit=self.MAX_PAGE_SIZE, offset=offset)
+        response = self.http_client.get(url, params=page_params)
+        response.raise_for_status()
+        return response.json()
+
+    def _iter_export(self, station_id: str, params: Dict[str, Any]) -> Iterator[pd.DataFrame]:
+        """
+        Lit l'export CSV complet d'une station en flux, par blocs de lignes.
+
+        Yields:
+            DataFrame: Les enregistrements, un bloc à la fois.
+        """
+        url = self.export_url_template.format(station_id=station_id)
+        export_params = dict(params, delimiter=";")
+
+        with self.http_client.get(url, params=export_params, stream=True) as response:
+            response.raise_for_status()
+            # Décompression gzip à la volée lors de la lecture du flux brut
+            response.raw.decode_content = True
+            reader = pd.read_csv(response.raw, sep=";", chunksize=self.export_chunk_size)
+            for chunk in reader:
+                yield chunk
+
+    def _build_select_params(self, columns: Optional[List[str]]) -> Dict[str, Any]:
+        """
+        Construit le paramètre `select` restreignant les colonnes renvoyées par l'API.
+
+        Returns:
+            Dict[str, Any]: Les paramètres de requête (vide sans projection).
+        """
+        if not columns:
+            return {}
+        return {"select": ",".join(columns)}
+
+    def _build_period_clause(self, since: Optional[Any], until: Optional[Any]) -> Optional[str]:
+        """
+        Construit la clause ODSQL `where` restreignant la période.
+
+        Returns:
+            Optional[str]: La clause, ou None si aucune borne n'est fournie.
+        """
+        conditions: List[str] = []
+        if since is not None:
+            conditions.append(f"{self.timestamp_field} >= date'{pd.Timestamp(since).isoformat()}'")
+        if until is not None:
+            conditions.append(f"{self.timestamp_field} <= date'{pd.Timestamp(until).isoformat()}'")
+        return " and ".join(conditions) or None
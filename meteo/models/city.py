@@ -2,6 +2,9 @@
 
 class City:
     """Représente une ville avec ses attributs."""
+
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         """
         Initialise un objet City.
@@ -0,0 +1,40 @@
+"""Modèle d'un prédicat simple sur une colonne, transmissible à une source de données."""
+
+
+class ColumnPredicate:
+    """
+    Représente la condition « la colonne contient (ou ne contient pas) un mot-clé »,
+    sans tenir compte de la casse.
+
+    Un filtre peut se décrire par une liste de prédicats (combinés par un ET
+    logique) afin qu'un loader compatible les applique côté serveur.
+    """
+
+    def __init__(self, column: str, keyword: str, negate: bool = False):
+        """
+        Initialise un prédicat.
+
+        Args:
+           - column (str): Le nom de la colonne concernée.
+           - keyword (str): Le mot-clé recherché.
+           - negate (bool): True si la colonne ne doit PAS contenir le mot-clé.
+        """
+        self.column = column
+        self.keyword = keyword
+        self.negate = negate
+
+    def __eq__(self, other) -> bool:
+        """Deux prédicats sont égaux s'ils portent sur la même condition."""
+        if not isinstance(other, ColumnPredicate):
+            return NotImplemented
+        return (self.column, self.keyword, self.negate) == (other.column, other.keyword, other.negate)
+
+    def __hash__(self) -> int:
+        """Permet d'utiliser les prédicats dans des ensembles."""
+        return hash((self.column, self.keyword, self.negate))
+
+    def __repr__(self) -> str:
+        """
+        Retourne la représentation de l'objet ColumnPredicate.
+        """
+        return f"ColumnPredicate(column='{self.column}', keyword='{self.keyword}', negate={self.negate})"
@@ -3,6 +3,9 @@
 class Station:
     """Représente une station météo avec ses informations d'identification."""
 
+    # Pas de __dict__ par instance : les stations d'un grand catalogue restent compactes
+    __slots__ = ("dataset_id", "city")
+
     def __init__(self, dataset_id: str, city: str):
         """
         Initialise un objet Station.
@@ -0,0 +1,39 @@
+"""Modèle du résultat du chargement d'une station lors d'un chargement groupé."""
+import pandas as pd
+from typing import Optional
+
+
+class StationFetchResult:
+    """
+    Représente l'issue du chargement d'une station : ses données, ou l'erreur
+    qui l'a interrompu (échec réseau, délai dépassé...). Une station en échec
+    n'interrompt pas le chargement des autres.
+    """
+
+    __slots__ = ("station_id", "data", "error")
+
+    def __init__(self, station_id: str, data: Optional[pd.DataFrame] = None, error: Optional[Exception] = None):
+        """
+        Initialise un résultat.
+
+        Args:
+           - station_id (str): L'identifiant de la station.
+           - data (Optional[DataFrame]): Les données chargées, si le chargement a réussi.
+           - error (Optional[Exception]): L'erreur rencontrée, si le chargement a échoué.
+        """
+        self.station_id = station_id
+        self.data = data
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """True si les données ont été chargées."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        """
+        Retourne la représentation de l'objet StationFetchResult.
+        """
+        if self.error is not None:
+            return f"StationFetchResult(station_id='{self.station_id}', error={self.error!r})"
+        return f"StationFetchResult(station_id='{self.station_id}', rows={len(self.data)})"
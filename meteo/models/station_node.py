@@ -9,6 +9,8 @@ class StationNode:
     Encapsule une station et maintient des références vers les nœuds adjacent.
     """
 
+    __slots__ = ("station", "next", "prev")
+
     def __init__(self, station: Station):
         """
         Initialise un nœud avec une station.
@@ -0,0 +1,95 @@
+"""Modèle d'un panel de mesures alignées sur une grille temporelle commune."""
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+
+
+class StationPanel:
+    """
+    Représente les mesures de plusieurs stations d'une ville, alignées sur une
+    même grille temporelle.
+
+    Chaque mesure est stockée dans un tableau NumPy contigu (float64) de forme
+    (instants, stations) : les statistiques entre stations (écart, rang, écart à
+    la moyenne de la ville) sont des opérations vectorisées sur une ligne.
+    Une valeur manquante (aucun relevé dans la tolérance) vaut NaN.
+    """
+
+    __slots__ = ("city", "times", "station_ids", "values")
+
+    def __init__(self, city: str, times: pd.DatetimeIndex, station_ids: List[str], values: Dict[str, np.ndarray]):
+        """
+        Initialise un panel.
+
+        Args:
+           - city (str): Le nom de la ville.
+           - times (DatetimeIndex): Les instants de la grille, croissants.
+           - station_ids (List[str]): Les stations, dans l'ordre des colonnes.
+           - values (Dict[str, ndarray]): Mesure -> tableau (instants, stations).
+        """
+        self.city = city
+        self.times = times
+        self.station_ids = station_ids
+        self.values = {
+            variable: np.ascontiguousarray(array, dtype=np.float64) for variable, array in values.items()
+        }
+
+    @property
+    def variables(self) -> List[str]:
+        """Les mesures disponibles."""
+        return list(self.values)
+
+    def get_values(self, variable: str) -> np.ndarray:
+        """
+        Retourne le tableau (instants, stations) d'une mesure, sans copie.
+
+        Raises:
+            KeyError: Si la mesure est absente du panel.
+        """
+        if variable not in self.values:
+            raise KeyError(f"Mesure inconnue : '{variable}'.")
+        return self.values[variable]
+
+    def city_mean(self, variable: str) -> np.ndarray:
+        """Moyenne de la ville à chaque instant (NaN si aucune station n'a de relevé)."""
+        array = self.get_values(variable)
+        counts = np.count_nonzero(~np.isnan(array), axis=1)
+        totals = np.nansum(array, axis=1)
+        return np.divide(totals, counts, out=np.full(len(array), np.nan), where=counts > 0)
+
+    def spread(self, variable: str) -> np.ndarray:
+        """Écart entre la station la plus haute et la plus basse, à chaque instant."""
+        array = self.get_values(variable)
+        present = ~np.isnan(array)
+        highest = np.where(present, array, -np.inf).max(axis=1, initial=-np.inf)
+        lowest = np.where(present, array, np.inf).min(axis=1, initial=np.inf)
+        return np.where(present.any(axis=1), highest - lowest, np.nan)
+
+    def deviation(self, variable: str) -> np.ndarray:
+        """Écart de chaque station à la moyenne de la ville, tableau (instants, stations)."""
+        return self.get_values(variable) - self.city_mean(variable)[:, np.newaxis]
+
+    def rank(self, variable: str) -> np.ndarray:
+        """
+        Rang de chaque station à chaque instant (1 = valeur la plus haute, ex aequo
+        au même rang, NaN sans relevé), tableau (instants, stations).
+        """
+        ranks = pd.DataFrame(self.get_values(variable)).rank(axis=1, method="min", ascending=False)
+        return ranks.to_numpy(dtype=np.float64)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Retourne le panel au format large : une colonne par mesure et par station
+        (colonnes à deux niveaux : mesure, station), indexé par la grille.
+        """
+        if not self.values:
+            return pd.DataFrame(index=self.times)
+        columns = pd.MultiIndex.from_product([self.variables, self.station_ids], names=["variable", "station_id"])
+        return pd.DataFrame(np.hstack(list(self.values.values())), index=self.times, columns=columns)
+
+    def __repr__(self) -> str:
+        """
+        Retourne la représentation de l'objet StationPanel.
+        """
+        return (f"StationPanel(city='{self.city}', times={len(self.times)}, "
+                f"stations={len(self.station_ids)}, variables={self.variables})")
@@ -1,7 +1,13 @@
 """Orchestrateur du workflow de l'application."""
 import requests
 import re
+import threading
+import pandas as pd
+from typing import Dict, Iterator, List, Optional
+from ..models.station_fetch_result import StationFetchResult
+from ..interfaces.navigation_interface import StationNavigator
 from ..services.weather_data_service import WeatherDataService
+from ..services.station_prefetcher import StationPrefetcher
 from ..services.user_selection_service import UserSelectionService
 from ..interfaces.base_interfaces import UserInterface
 from ..commands.navigation_commands import NextStationCommand, PreviousStationCommand
@@ -18,11 +24,19 @@ class WeatherStationOrchestrator:
         self,
         data_service: WeatherDataService,
         selection_service: UserSelectionService,
-        ui: UserInterface
+        ui: UserInterface,
+        prefetch_city: bool = True,
+        station_prefetcher: Optional[StationPrefetcher] = None
     ):
         self.data_service = data_service
         self.selection_service = selection_service
         self.ui = ui
+        # Chargement en arrière-plan de toutes les stations de la ville choisie
+        self.prefetch_city = prefetch_city
+        self._prefetched: Dict[str, StationFetchResult] = {}
+        self._prefetch_generation = 0
+        # Chargement spéculatif des stations voisines pendant la consultation
+        self.station_prefetcher = station_prefetcher
 
     def run(self):
         """
@@ -86,18 +100,24 @@ class WeatherStationOrchestrator:
 
         # Construire la liste des stations pour le choix initial
         stations_list = []
+        station_ids = []
         temp_navigator = station_navigator
         for i in range(station_navigator.get_total()):
             current = temp_navigator.get_current()
             if current:
                 display_name = clean_station_name(current.dataset_id)
                 stations_list.append(display_name)
+                station_ids.append(current.dataset_id)
             if temp_navigator.has_next():
                 temp_navigator.next()
 
         # Réinitialiser le navigateur
         station_navigator.reset()
 
+        # Les stations de la ville se chargent pendant que l'utilisateur choisit
+        if self.prefetch_city:
+            self._start_prefetch(station_ids)
+
         # Sélection initiale de la station
         chosen_display_name = self.selection_service.select_item_from_list(
             stations_list,
@@ -111,9 +131,7 @@ class WeatherStationOrchestrator:
 
         # Positionner le navigateur sur la station choisie
         chosen_index = stations_list.index(chosen_display_name)
-        station_navigator.reset()
-        for _ in range(chosen_index):
-            station_navigator.next()
+        station_navigator.seek(chosen_index)
 
         # Boucle d'affichage des données avec navigation
         while True:
@@ -131,7 +149,7 @@ class WeatherStationOrchestrator:
             self.ui.display_message(f"ID: {current_station.dataset_id}")
             self.ui.display_message("Chargement des données...")
 
-            station_data = self.data_service.get_station_data(current_station.dataset_id)
+            station_data = self._get_station_data(current_station.dataset_id)
 
             if station_data.empty:
                 self.ui.display_message("⚠ Aucune donnée disponible pour cette station.")
@@ -140,6 +158,9 @@ class WeatherStationOrchestrator:
                 self.ui.display_header("APERÇU DES DERNIÈRES DONNÉES")
                 self.ui.display_dataframe(station_data)
 
+            # Les voisines se chargent pendant que l'utilisateur lit et choisit
+            self._prefetch_neighbours(station_navigator)
+
             # Options de navigation après affichage
             # Création des commandes (Pattern Command)
             navigation_options = {}
@@ -173,4 +194,73 @@ class WeatherStationOrchestrator:
                 return
             
             if not should_continue:
-                return
\ No newline at end of file
+                return
+
+    def _start_prefetch(self, station_ids: List[str]) -> None:
+        """
+        Lance le chargement groupé des stations dans un thread d'arrière-plan.
+        Un chargement précédent (autre ville) est abandonné.
+        """
+        self._prefetch_generation += 1
+        self._prefetched = {}
+        results = self.data_service.fetch_stations_data(station_ids)
+        threading.Thread(
+            target=self._collect_prefetch,
+            args=(results, self._prefetch_generation, self._prefetched),
+            daemon=True
+        ).start()
+
+    def _collect_prefetch(
+        self,
+        results: Iterator[StationFetchResult],
+        generation: int,
+        prefetched: Dict[str, StationFetchResult]
+    ) -> None:
+        """Range les résultats du chargement groupé au fil de leur arrivée."""
+        for result in results:
+            if generation != self._prefetch_generation:
+                # Ville abandonnée : fermer le générateur annule les stations restantes
+                results.close()
+                return
+            prefetched[result.station_id] = result
+
+    def _get_station_data(self, station_id: str) -> pd.DataFrame:
+        """
+        Retourne les données d'une station, depuis le chargement groupé si elles
+        y sont déjà disponibles, sinon par un chargement direct.
+        Un résultat du chargement groupé ne sert qu'une fois : les visites
+        suivantes passent par le service (cache, durée de vie, rafraîchissement).
+        """
+        result = self._prefetched.pop(station_id, None)
+        if result is not None and result.ok:
+            return result.data
+
+        if self.station_prefetcher is not None:
+            station_data = self.station_prefetcher.get(station_id)
+            if station_data is not None:
+                return station_data
+
+        return self.data_service.get_station_data(station_id)
+
+    def _prefetch_neighbours(self, station_navigator: StationNavigator) -> None:
+        """
+        Précharge la station précédente et la suivante, et abandonne les
+        préchargements devenus inutiles (après un saut vers une autre station).
+        """
+        if self.station_prefetcher is None:
+            return
+
+        current = station_navigator.get_current()
+        neighbours = []
+        if station_navigator.has_previous():
+            neighbours.append(station_navigator.peek(-1))
+        if station_navigator.has_next():
+            neighbours.append(station_navigator.peek(1))
+
+        neighbour_ids = [station.dataset_id for station in neighbours if station is not None]
+        self.station_prefetcher.retain(neighbour_ids + ([current.dataset_id] if current else []))
+        # Inutile de précharger ce que le chargement groupé a déjà obtenu
+        self.station_prefetcher.prefetch(
+            station_id for station_id in neighbour_ids
+            if not (station_id in self._prefetched and self._prefetched[station_id].ok)
+        )
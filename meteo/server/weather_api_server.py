@@ -0,0 +1,265 @@
+"""Serveur HTTP local (asyncio) exposant les villes, stations et données météo en JSON."""
+import asyncio
+import json
+import requests
+import pandas as pd
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+from ..services.aggregation_service import StationAggregationService
+from ..services.weather_data_service import WeatherDataService
+
+
+class WeatherApiServer:
+    """
+    Expose WeatherDataService aux autres outils via une petite API HTTP :
+    - GET /cities                       -> liste des villes ;
+    - GET /cities/{ville}/stations      -> stations d'une ville ;
+    - GET /stations/{id}/data           -> dernières données d'une station ;
+    - GET /stations/{id}/summary?frequency=hourly|daily|monthly
+                                        -> min/max/moyenne/nombre par période.
+
+    Le service (bloquant) s'exécute dans un pool de threads. Les requêtes
+    simultanées portant sur la même ressource partagent un seul appel au service
+    (single-flight), et les données déjà en cache sont servies directement depuis
+    la boucle d'événements, avec leur encodage JSON mémorisé.
+    """
+
+    STATUS_TEXTS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+                    414: "URI Too Long", 500: "Internal Server Error", 502: "Bad Gateway"}
+
+    def __init__(
+        self,
+        data_service: WeatherDataService,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        max_workers: int = 8,
+        max_encoded: int = 1024,
+        aggregation_service: Optional[StationAggregationService] = None
+    ):
+        """
+        Initialise le serveur.
+
+        Args:
+            data_service (WeatherDataService): Le service de données à exposer.
+            host (str): L'adresse d'écoute.
+            port (int): Le port d'écoute.
+            max_workers (int): Nombre d'appels simultanés au service.
+            max_encoded (int): Nombre de réponses JSON de stations mémorisées.
+            aggregation_service (Optional[StationAggregationService]): Active la route
+                des résumés par période.
+        """
+        self.data_service = data_service
+        self.aggregation_service = aggregation_service
+        self.host = host
+        self.port = port
+        self.max_encoded = max_encoded
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="api-worker")
+        # Appels au service en cours, partagés par les requêtes identiques
+        self._in_flight: Dict[Tuple[str, str], asyncio.Future] = {}
+        # Encodage JSON des DataFrames servis : station -> (DataFrame, corps)
+        self._encoded: "OrderedDict[str, Tuple[pd.DataFrame, bytes]]" = OrderedDict()
+
+    def run(self) -> None:
+        """Démarre le serveur et le laisse tourner jusqu'à son interruption (Ctrl+C)."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def serve_forever(self) -> None:
+        """Ouvre le port d'écoute et traite les connexions."""
+        server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        print(f"API météo à l'écoute sur http://{self.host}:{self.port}")
+        async with server:
+            await server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Traite les requêtes successives d'une connexion (keep-alive HTTP/1.1)."""
+        try:
+            while True:
+                # Une ligne plus longue que la limite du flux lève ValueError
+                try:
+                    request_line = await reader.readline()
+                except ValueError:
+                    await self._write_response(writer, 414, {"error": "Ligne de requête trop longue"},
+                                               keep_alive=False)
+                    break
+                if not request_line:
+                    break
+
+                try:
+                    headers = await self._read_headers(reader)
+                except ValueError:
+                    await self._write_response(writer, 400, {"error": "En-tête trop long"}, keep_alive=False)
+                    break
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await self._write_response(writer, 400, {"error": "Requête invalide"}, keep_alive=False)
+                    break
+
+                method, target, version = parts
+                # Un éventuel corps est lu puis ignoré
+                content_length = headers.get("content-length", "0").strip() or "0"
+                if not (content_length.isascii() and content_length.isdigit()):
+                    await self._write_response(writer, 400, {"error": "En-tête Content-Length invalide"},
+                                               keep_alive=False)
+                    break
+                content_length = int(content_length)
+                if content_length:
+                    await reader.readexactly(content_length)
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection == "keep-alive" if version == "HTTP/1.0" else connection != "close"
+
+                if method != "GET":
+                    status, body = 405, {"error": "Seule la méthode GET est acceptée"}
+                else:
+                    url = urlsplit(target)
+                    status, body = await self._dispatch(url.path, parse_qs(url.query))
+
+                await self._write_response(writer, status, body, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> Dict[str, str]:
+        """Lit les en-têtes d'une requête (noms en minuscules)."""
+        headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _dispatch(self, path: str, query: Optional[Dict[str, list]] = None) -> Tuple[int, Any]:
+        """
+        Associe un chemin (et ses paramètres) à sa ressource.
+
+        Returns:
+            Tuple[int, Any]: Le code HTTP et le corps (objet JSON ou octets déjà encodés).
+        """
+        segments = [unquote(segment) for segment in path.strip("/").split("/")]
+
+        try:
+            if segments == ["cities"]:
+                return 200, {"cities": await self._coalesce(("cities", ""), self.data_service.get_cities)}
+
+            if len(segments) == 3 and segments[0] == "cities" and segments[2] == "stations":
+                station_ids = await self._coalesce(("stations", segments[1]), self._get_station_ids, segments[1])
+                if not station_ids:
+                    return 404, {"error": f"Aucune station pour la ville '{segments[1]}'"}
+                return 200, {"city": segments[1], "stations": station_ids}
+
+            if len(segments) == 3 and segments[0] == "stations" and segments[2] == "data":
+                return await self._get_station_data(segments[1])
+
+            if (len(segments) == 3 and segments[0] == "stations" and segments[2] == "summary"
+                    and self.aggregation_service is not None):
+                frequency = (query or {}).get("frequency", ["daily"])[0]
+                return await self._get_station_summary(segments[1], frequency)
+
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except requests.exceptions.RequestException as e:
+            return 502, {"error": f"Impossible de joindre l'API source : {e}"}
+        except Exception as e:
+            return 500, {"error": f"Erreur inattendue : {e}"}
+
+        return 404, {"error": f"Ressource inconnue : {path}"}
+
+    async def _get_station_data(self, station_id: str) -> Tuple[int, Any]:
+        """Sert les données d'une station, depuis le cache si possible."""
+        station_data = self.data_service.get_cached_station_data(station_id)
+        if station_data is None:
+            station_data = await self._coalesce(("data", station_id), self.data_service.get_station_data, station_id)
+
+        if station_data.empty:
+            return 404, {"error": f"Aucune donnée pour la station '{station_id}'"}
+        return 200, self._encode_station_data(station_id, station_data)
+
+    async def _get_station_summary(self, station_id: str, frequency: str) -> Tuple[int, Any]:
+        """Résume par période les données d'une station (servies depuis le cache si possible)."""
+        station_data = self.data_service.get_cached_station_data(station_id)
+        if station_data is None:
+            station_data = await self._coalesce(("data", station_id), self.data_service.get_station_data, station_id)
+
+        if station_data.empty:
+            return 404, {"error": f"Aucune donnée pour la station '{station_id}'"}
+
+        summary = self.aggregation_service.aggregate(station_data, frequency)
+        records = summary.reset_index().to_json(orient="records", date_format="iso", force_ascii=False)
+        body = f'{{"station_id": {json.dumps(station_id)}, "frequency": {json.dumps(frequency)}, "summary": {records}}}'
+        return 200, body.encode("utf-8")
+
+    def _get_station_ids(self, city_name: str) -> list:
+        """Retourne les identifiants des stations d'une ville, dans l'ordre de navigation."""
+        navigator = self.data_service.get_stations_for_city(city_name)
+        station_ids = []
+        station = navigator.get_current()
+        while station is not None:
+            station_ids.append(station.dataset_id)
+            station = navigator.next()
+        return station_ids
+
+    def _encode_station_data(self, station_id: str, station_data: pd.DataFrame) -> bytes:
+        """
+        Encode les données d'une station en JSON, en réutilisant l'encodage
+        précédent tant que le DataFrame en cache est le même objet.
+        """
+        encoded = self._encoded.get(station_id)
+        if encoded is not None and encoded[0] is station_data:
+            self._encoded.move_to_end(station_id)
+            return encoded[1]
+
+        records = station_data.to_json(orient="records", date_format="iso", force_ascii=False)
+        body = f'{{"station_id": {json.dumps(station_id)}, "data": {records}}}'.encode("utf-8")
+
+        self._encoded[station_id] = (station_data, body)
+        self._encoded.move_to_end(station_id)
+        while len(self._encoded) > self.max_encoded:
+            self._encoded.popitem(last=False)
+        return body
+
+    async def _coalesce(self, key: Tuple[str, str], func: Callable, *args) -> Any:
+        """
+        Exécute func dans le pool de threads, une seule fois pour toutes les
+        requêtes simultanées de même clé (single-flight).
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # shield : l'abandon d'une requête n'annule pas l'appel partagé
+        return await asyncio.shield(future)
+
+    async def _write_response(
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        body: Any,
+        keep_alive: bool
+    ) -> None:
+        """Écrit une réponse JSON complète."""
+        if not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+        head = (
+            f"HTTP/1.1 {status} {self.STATUS_TEXTS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
@@ -0,0 +1,150 @@
+"""Service d'agrégation temporelle (horaire, journalière, mensuelle) des données de station."""
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+class StationAggregationService:
+    """
+    Résume les relevés de stations par période : minimum, maximum, moyenne et
+    nombre de relevés de chaque mesure.
+
+    Les calculs reposent sur les agrégations vectorisées de pandas (resample,
+    groupby) sur un horodatage parsé une seule fois : aucune boucle Python par
+    relevé, et plusieurs stations sont résumées en une seule passe sur un
+    DataFrame au format long.
+    """
+
+    # Fréquences proposées -> règles pandas (les mois commencent le 1er)
+    FREQUENCIES = {"hourly": "h", "daily": "D", "monthly": "MS"}
+    STATISTICS = ["min", "max", "mean", "count"]
+
+    def __init__(
+        self,
+        timestamp_col: str,
+        value_columns: List[str],
+        station_col: str = "station_id",
+        timezone: str = "Europe/Paris"
+    ):
+        """
+        Initialise le service.
+
+        Args:
+            timestamp_col (str): Colonne des horodatages (texte ISO ou datetime).
+            value_columns (List[str]): Mesures à résumer (température, humidité, pression...).
+            station_col (str): Colonne identifiant la station dans un DataFrame long.
+            timezone (str): Fuseau dans lequel les périodes sont découpées.
+        """
+        self.timestamp_col = timestamp_col
+        self.value_columns = value_columns
+        self.station_col = station_col
+        self.timezone = timezone
+
+    def aggregate(self, station_data: pd.DataFrame, frequency: str = "daily") -> pd.DataFrame:
+        """
+        Résume les relevés d'une station.
+
+        Args:
+            station_data (DataFrame): Les relevés de la station.
+            frequency (str): 'hourly', 'daily' ou 'monthly'.
+
+        Returns:
+            DataFrame: Une ligne par période (index : début de période), une colonne
+                       par mesure et statistique (ex: 'temperature_en_degre_c_mean').
+                       Les périodes sans relevé sont omises.
+        """
+        frame = self._prepare(station_data)
+        if frame.empty:
+            return self._empty_result()
+
+        summary = frame.set_index(self.timestamp_col).resample(self._get_rule(frequency)).agg(self.STATISTICS)
+        return self._finalize(summary)
+
+    def aggregate_many(self, long_data: pd.DataFrame, frequency: str = "daily") -> pd.DataFrame:
+        """
+        Résume les relevés de plusieurs stations en une seule passe.
+
+        Args:
+            long_data (DataFrame): Relevés au format long (une colonne station_col).
+            frequency (str): 'hourly', 'daily' ou 'monthly'.
+
+        Returns:
+            DataFrame: Une ligne par station et par période (index à deux niveaux).
+        """
+        if self.station_col not in long_data.columns:
+            raise KeyError(f"La colonne '{self.station_col}' est introuvable.")
+
+        frame = self._prepare(long_data, extra_columns=[self.station_col])
+        if frame.empty:
+            return self._empty_result()
+
+        grouper = pd.Grouper(key=self.timestamp_col, freq=self._get_rule(frequency))
+        summary = frame.groupby([self.station_col, grouper], observed=True, sort=True).agg(self.STATISTICS)
+        return self._finalize(summary)
+
+    def to_long_format(self, frames: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+        """
+        Assemble les relevés de plusieurs stations en un DataFrame long.
+
+        Args:
+            frames (Dict[str, DataFrame]): Identifiant de station -> relevés.
+
+        Returns:
+            DataFrame: Les relevés concaténés, avec la colonne station_col.
+        """
+        non_empty = {station_id: df for station_id, df in frames.items() if not df.empty}
+        if not non_empty:
+            return pd.DataFrame(columns=[self.station_col, self.timestamp_col] + self.value_columns)
+
+        long_data = pd.concat(non_empty, names=[self.station_col, None]).reset_index(level=0)
+        return long_data.reset_index(drop=True)
+
+    def _prepare(self, df: pd.DataFrame, extra_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Sélectionne les colonnes utiles et parse l'horodatage dans le fuseau configuré.
+
+        Raises:
+            KeyError: Si la colonne d'horodatage est absente.
+        """
+        if df.empty:
+            return df
+        if self.timestamp_col not in df.columns:
+            raise KeyError(f"La colonne '{self.timestamp_col}' est introuvable.")
+
+        values = [col for col in self.value_columns if col in df.columns]
+        frame = df[(extra_columns or []) + [self.timestamp_col] + values].copy()
+        frame[self.timestamp_col] = self._parse_timestamps(frame[self.timestamp_col])
+        for column in values:
+            frame[column] = pd.to_numeric(frame[column], errors="coerce")
+        return frame.dropna(subset=[self.timestamp_col])
+
+    def _parse_timestamps(self, timestamps: pd.Series) -> pd.Series:
+        """Convertit les horodatages (texte, naïfs en UTC ou avec fuseau) vers le fuseau configuré."""
+        if not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(timestamps, utc=True)
+        elif timestamps.dt.tz is None:
+            timestamps = timestamps.dt.tz_localize("UTC")
+        return timestamps.dt.tz_convert(self.timezone)
+
+    def _get_rule(self, frequency: str) -> str:
+        """
+        Retourne la règle pandas d'une fréquence.
+
+        Raises:
+            ValueError: Si la fréquence est inconnue.
+        """
+        rule = self.FREQUENCIES.get(frequency)
+        if rule is None:
+            raise ValueError(f"Fréquence inconnue : '{frequency}' (attendu : {', '.join(self.FREQUENCIES)}).")
+        return rule
+
+    def _finalize(self, summary: pd.DataFrame) -> pd.DataFrame:
+        """Aplatit les colonnes (mesure_statistique) et retire les périodes sans relevé."""
+        summary.columns = [f"{column}_{statistic}" for column, statistic in summary.columns]
+        counts = summary[[col for col in summary.columns if col.endswith("_count")]]
+        return summary[counts.sum(axis=1).to_numpy() > 0]
+
+    def _empty_result(self) -> pd.DataFrame:
+        """Résultat vide aux colonnes attendues."""
+        return pd.DataFrame(columns=[
+            f"{column}_{statistic}" for column in self.value_columns for statistic in self.STATISTICS
+        ])
@@ -0,0 +1,134 @@
+"""Index inversé ville → stations construit une seule fois par chargement du catalogue."""
+import numpy as np
+import pandas as pd
+from array import array
+from typing import Any, Callable, Dict, List, Optional
+from ..extractors.data_extractor import DataExtractor
+from ..interfaces.base_interfaces import DataFilter
+from ..models.station import Station
+from .station_registry import StationRegistry
+
+
+class CatalogIndex:
+    """
+    Précalcule, à partir du catalogue traité :
+    - la liste triée des villes ;
+    - pour chaque ville, la liste triée de ses stations ;
+    - pour chaque station, ses métadonnées (ligne du catalogue).
+
+    Les clés de tri sont calculées une seule fois, sur des colonnes entières :
+    villes et stations sont stockées déjà ordonnées.
+
+    Les recherches deviennent de simples accès à des dictionnaires. Chaque
+    station n'existe qu'une fois, dans le registre de l'index : les villes ne
+    conservent que des tableaux d'index entiers.
+    """
+
+    def __init__(
+        self,
+        catalog: pd.DataFrame,
+        extractor: DataExtractor,
+        city_filter_factory: Callable[[str], DataFilter],
+        station_sort_key: Optional[Callable[[pd.Series], pd.Series]] = None
+    ):
+        """
+        Construit l'index.
+
+        Args:
+            catalog (DataFrame): Le catalogue traité.
+            extractor (DataExtractor): Extracteur configuré (colonnes et tri naturel).
+            city_filter_factory (Callable): Fabrique du filtre de ville. Elle est
+                utilisée une fois par ville pour conserver exactement la même règle
+                de correspondance qu'une recherche directe.
+            station_sort_key (Optional[Callable]): Calcule, pour une colonne
+                d'identifiants, les clés de l'ordre de navigation (par exemple
+                StationNavigatorFactory.get_sort_keys). Sans elle, les stations
+                d'une ville suivent l'ordre naturel de l'extracteur.
+        """
+        self.source = catalog
+        self.registry = StationRegistry()
+        self._cities: List[str] = []
+        self._stations_by_city: Dict[str, array] = {}
+        self._station_metadata: Dict[str, Dict[str, Any]] = {}
+
+        if not catalog.empty:
+            self._build(catalog, extractor, city_filter_factory, station_sort_key)
+
+    def _build(
+        self,
+        catalog: pd.DataFrame,
+        extractor: DataExtractor,
+        city_filter_factory: Callable[[str], DataFilter],
+        station_sort_key: Optional[Callable[[pd.Series], pd.Series]]
+    ) -> None:
+        """Remplit les dictionnaires de l'index."""
+        self._cities = extractor.get_unique_cities(catalog)
+
+        # Les filtres de ville ne parcourent que les couples (ville, station) distincts
+        pairs = catalog[[extractor.city_col, extractor.station_id_col]].drop_duplicates()
+        pairs = pairs.dropna(subset=[extractor.station_id_col])
+
+        # Tri unique des couples : ordre naturel, puis ordre de navigation (tris stables).
+        # Les filtres conservant l'ordre des lignes, chaque ville en hérite directement.
+        pairs = pairs.iloc[extractor.natural_sort_order(pairs[extractor.station_id_col])]
+        if station_sort_key is not None:
+            keys = station_sort_key(pairs[extractor.station_id_col]).to_numpy(dtype=object)
+            pairs = pairs.iloc[np.argsort(keys, kind="stable")]
+
+        for city in self._cities:
+            city_pairs = city_filter_factory(city).filter(pairs)
+            self._stations_by_city[city] = array("i", (
+                self.registry.get_or_create(station_id, city)
+                for station_id in city_pairs[extractor.station_id_col].drop_duplicates()
+            ))
+
+        unique_stations = catalog.drop_duplicates(subset=extractor.station_id_col)
+        self._station_metadata = unique_stations.set_index(extractor.station_id_col).to_dict("index")
+
+    def get_cities(self) -> List[str]:
+        """
+        Retourne la liste triée des villes.
+
+        Returns:
+            List[str]: Les villes (copie de la liste indexée).
+        """
+        return list(self._cities)
+
+    def get_station_ids(self, city_name: str) -> Optional[List[str]]:
+        """
+        Retourne les stations triées d'une ville.
+
+        Args:
+            city_name (str): Le nom de la ville.
+
+        Returns:
+            Optional[List[str]]: Les identifiants, ou None si la ville n'est pas indexée.
+        """
+        stations = self.get_stations(city_name)
+        return None if stations is None else [station.dataset_id for station in stations]
+
+    def get_stations(self, city_name: str) -> Optional[List[Station]]:
+        """
+        Retourne les stations triées d'une ville, partagées avec le registre.
+
+        Args:
+            city_name (str): Le nom de la ville.
+
+        Returns:
+            Optional[List[Station]]: Les stations, ou None si la ville n'est pas indexée.
+        """
+        indices = self._stations_by_city.get(city_name)
+        return None if indices is None else [self.registry[index] for index in indices]
+
+    def get_station_metadata(self, station_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne les métadonnées du catalogue pour une station.
+
+        Args:
+            station_id (str): L'identifiant de la station.
+
+        Returns:
+            Optional[Dict[str, Any]]: Les colonnes du catalogue, ou None si la station est inconnue.
+        """
+        metadata = self._station_metadata.get(station_id)
+        return None if metadata is None else dict(metadata)
@@ -0,0 +1,219 @@
+"""Navigateur de stations adossé à un tableau, avec accès direct par position."""
+from array import array
+from typing import Dict, List, Optional, Union
+from ..models.station import Station
+from ..interfaces.navigation_interface import StationNavigator
+from .station_registry import StationRegistry
+
+
+class StationArrayNavigator(StationNavigator):
+    """
+    Navigateur de stations stockées dans une liste indexée.
+    Implémente l'interface StationNavigator avec un curseur entier : la position,
+    le positionnement direct et la recherche par identifiant sont en O(1).
+
+    Les stations ne sont pas copiées : le navigateur ne conserve qu'un tableau
+    compact d'index vers un StationRegistry, partagé avec le catalogue.
+    """
+
+    def __init__(self, stations: Optional[List[Station]] = None, registry: Optional[StationRegistry] = None):
+        """
+        Initialise le navigateur.
+
+        Args:
+            stations (Optional[List[Station]]): Stations initiales, dans l'ordre de navigation.
+            registry (Optional[StationRegistry]): Registre partagé des stations. Un
+                                                  registre privé est créé s'il est absent.
+        """
+        self._registry = registry if registry is not None else StationRegistry()
+        self._indices = array("i")
+        # Identifiant de station -> position dans le navigateur
+        self._positions: Dict[str, int] = {}
+        self._cursor: int = 0
+
+        for station in stations or []:
+            self.add_station(station)
+
+    def add_station(self, station: Station) -> None:
+        """
+        Ajoute une station à la fin du navigateur.
+
+        Args:
+            station (Station): La station à ajouter.
+        """
+        self.add_index(self._registry.register(station))
+
+    def add_index(self, registry_index: int) -> None:
+        """
+        Ajoute à la fin du navigateur une station déjà présente dans le registre.
+
+        Args:
+            registry_index (int): L'index de la station dans le registre.
+        """
+        self._positions.setdefault(self._registry[registry_index].dataset_id, len(self._indices))
+        self._indices.append(registry_index)
+
+    def next(self) -> Optional[Station]:
+        """
+        Avance à la station suivante.
+
+        Returns:
+            Station: La station suivante, ou None si on est à la fin.
+        """
+        if not self.has_next():
+            return None
+
+        self._cursor += 1
+        return self._station_at(self._cursor)
+
+    def previous(self) -> Optional[Station]:
+        """
+        Recule à la station précédente.
+
+        Returns:
+            Station: La station précédente, ou None si on est au début.
+        """
+        if not self.has_previous():
+            return None
+
+        self._cursor -= 1
+        return self._station_at(self._cursor)
+
+    def get_current(self) -> Optional[Station]:
+        """
+        Retourne la station actuellement sélectionnée.
+
+        Returns:
+            Station: La station courante, ou None si le navigateur est vide.
+        """
+        if not self._indices:
+            return None
+        return self._station_at(self._cursor)
+
+    def has_next(self) -> bool:
+        """
+        Vérifie s'il existe une station suivante.
+
+        Returns:
+            bool: True si une station suivante existe, False sinon.
+        """
+        return self._cursor + 1 < len(self._indices)
+
+    def has_previous(self) -> bool:
+        """
+        Vérifie s'il existe une station précédente.
+
+        Returns:
+            bool: True si une station précédente existe, False sinon.
+        """
+        return bool(self._indices) and self._cursor > 0
+
+    def reset(self) -> None:
+        """Réinitialise la navigation au début (première station)."""
+        self._cursor = 0
+
+    def seek(self, index: int) -> Station:
+        """
+        Positionne le curseur directement sur une station.
+
+        Args:
+            index (int): La position visée (commence à 0).
+
+        Returns:
+            Station: La station désormais courante.
+
+        Raises:
+            IndexError: Si la position est hors limites.
+        """
+        if not 0 <= index < len(self._indices):
+            raise IndexError(f"Position de station invalide : {index}")
+
+        self._cursor = index
+        return self._station_at(index)
+
+    def seek_to(self, station_id: str) -> Optional[Station]:
+        """
+        Positionne le curseur sur la station d'identifiant donné.
+
+        Args:
+            station_id (str): L'identifiant de la station.
+
+        Returns:
+            Optional[Station]: La station courante, ou None si l'identifiant est
+                               inconnu (le curseur ne bouge pas).
+        """
+        index = self._positions.get(station_id)
+        if index is None:
+            return None
+        return self.seek(index)
+
+    def peek(self, offset: int) -> Optional[Station]:
+        """
+        Retourne la station située à `offset` positions du curseur, sans le déplacer.
+
+        Args:
+            offset (int): Le décalage (négatif pour les stations précédentes).
+
+        Returns:
+            Optional[Station]: La station, ou None si la position est hors limites.
+        """
+        index = self._cursor + offset
+        if not 0 <= index < len(self._indices):
+            return None
+        return self._station_at(index)
+
+    def get_window(self, radius: int) -> List[Station]:
+        """
+        Retourne les stations entourant le curseur.
+
+        Args:
+            radius (int): Le nombre de stations de part et d'autre du curseur.
+
+        Returns:
+            List[Station]: Au plus 2 * radius + 1 stations, dans l'ordre.
+        """
+        return self[max(0, self._cursor - radius):self._cursor + radius + 1]
+
+    def get_position(self) -> int:
+        """
+        Retourne la position actuelle (1-indexed).
+
+        Returns:
+            int: La position de la station courante (commence à 1).
+        """
+        if not self._indices:
+            return 0
+        return self._cursor + 1
+
+    def get_total(self) -> int:
+        """
+        Retourne le nombre total de stations.
+
+        Returns:
+            int: Le nombre total de stations.
+        """
+        return len(self._indices)
+
+    def __getitem__(self, item: Union[int, slice]) -> Union[Station, List[Station]]:
+        """Permet l'accès direct par position ou par tranche (navigator[2], navigator[1:4])."""
+        if isinstance(item, slice):
+            return [self._registry[index] for index in self._indices[item]]
+        return self._registry[self._indices[item]]
+
+    def _station_at(self, position: int) -> Station:
+        """Retourne la station située à une position du navigateur."""
+        return self._registry[self._indices[position]]
+
+    def __len__(self) -> int:
+        """Permet d'utiliser len(navigator) pour obtenir le nombre de stations."""
+        return len(self._indices)
+
+    def __str__(self) -> str:
+        """Retourne une représentation lisible du navigateur."""
+        if not self._indices:
+            return "StationArrayNavigator(vide)"
+        return f"StationArrayNavigator({len(self._indices)} stations, position={self.get_position()})"
+
+    def __repr__(self) -> str:
+        """Retourne la représentation de l'objet."""
+        return f"StationArrayNavigator(size={len(self._indices)}, current_pos={self.get_position()})"
@@ -0,0 +1,183 @@
+"""Export non interactif des données de stations vers des fichiers, avec manifeste."""
+import json
+import os
+import pandas as pd
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from ..storage.columnar import PARQUET_AVAILABLE, SUPPORTED_FORMATS, resolve_format, write_frame
+from ..storage.measurement_arrays import write_measurement_arrays
+from .weather_data_service import WeatherDataService
+
+
+class StationExportService:
+    """
+    Écrit un fichier par station (CSV, parquet ou npz) dans un répertoire, puis
+    un manifeste `manifest.json` décrivant chaque fichier produit et chaque
+    station en échec. Le format 'memmap' produit à la place un dossier par
+    station de tableaux binaires (voir storage.measurement_arrays), que les
+    outils d'analyse ouvrent par projection mémoire : il contient tout
+    l'historique de la station (voir WeatherDataService.get_station_history()),
+    et une station sans relevé horodaté y est signalée sans dossier ('empty').
+
+    Les stations sont chargées simultanément via WeatherDataService : ce service
+    ne dépend d'aucune interface utilisateur et convient aux tâches planifiées.
+    Une station dont l'API est injoignable, ou dont l'écriture échoue, est
+    comptée en échec sans interrompre les autres.
+    """
+
+    EXPORT_FORMATS = ("csv",) + SUPPORTED_FORMATS + ("memmap",)
+    # Formats utilisables dans cet environnement (parquet nécessite pyarrow)
+    AVAILABLE_FORMATS = tuple(f for f in EXPORT_FORMATS if f != "parquet" or PARQUET_AVAILABLE)
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(
+        self,
+        data_service: WeatherDataService,
+        file_format: str = "csv",
+        measure_columns: Optional[List[str]] = None
+    ):
+        """
+        Initialise le service d'export.
+
+        Args:
+            data_service (WeatherDataService): Le service fournissant villes et stations.
+            file_format (str): 'csv', 'parquet', 'npz' ou 'memmap'.
+            measure_columns (Optional[List[str]]): Mesures écrites au format 'memmap'.
+
+        Raises:
+            ValueError: Si le format est inconnu, ou 'memmap' sans mesures.
+            ImportError: Si 'parquet' est demandé sans que pyarrow soit installé.
+        """
+        if file_format not in self.EXPORT_FORMATS:
+            raise ValueError(f"Format d'export inconnu : '{file_format}'.")
+        if file_format == "memmap" and not measure_columns:
+            raise ValueError("Le format 'memmap' nécessite la liste des mesures à écrire.")
+        if file_format in SUPPORTED_FORMATS:
+            resolve_format(file_format)
+
+        self.data_service = data_service
+        self.file_format = file_format
+        self.measure_columns = list(measure_columns or [])
+
+    def export(
+        self,
+        out_dir: str,
+        cities: Optional[List[str]] = None,
+        station_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Exporte les stations des villes demandées.
+
+        Args:
+            out_dir (str): Le répertoire de destination (créé si besoin).
+            cities (Optional[List[str]]): Les villes à exporter (toutes si None).
+            station_ids (Optional[List[str]]): Restreint l'export à ces stations
+                                               (toutes les stations des villes si None).
+
+        Returns:
+            Dict[str, Any]: Le manifeste, également écrit dans out_dir.
+        """
+        os.makedirs(out_dir, exist_ok=True)
+
+        station_cities = self._select_stations(cities, station_ids)
+        results = self.data_service.fetch_stations_data(
+            list(station_cities), raise_errors=True, history=self.file_format == "memmap"
+        )
+        entries = []
+        for result in results:
+            entry: Dict[str, Any] = {"station_id": result.station_id, "city": station_cities[result.station_id]}
+            if result.ok:
+                try:
+                    entry.update(self._write_station(out_dir, result.station_id, result.data))
+                except Exception as e:
+                    entry.update({"status": "error", "error": str(e)})
+            else:
+                entry.update({"status": "error", "error": str(result.error)})
+            entries.append(entry)
+
+        entries.sort(key=lambda entry: entry["station_id"])
+        manifest = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "format": self.file_format,
+            "cities": sorted(set(station_cities.values())),
+            "stations": entries,
+            "failed": sum(entry["status"] == "error" for entry in entries)
+        }
+
+        manifest_path = os.path.join(out_dir, self.MANIFEST_NAME)
+        with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+        return manifest
+
+    def _select_stations(self, cities: Optional[List[str]], station_ids: Optional[List[str]]) -> Dict[str, str]:
+        """
+        Associe chaque station à exporter à sa ville (la première qui la contient).
+
+        Returns:
+            Dict[str, str]: Identifiant de station -> ville.
+        """
+        wanted = None if station_ids is None else set(station_ids)
+        station_cities: Dict[str, str] = {}
+
+        for city in cities if cities is not None else self.data_service.get_cities():
+            navigator = self.data_service.get_stations_for_city(city)
+            station = navigator.get_current()
+            while station is not None:
+                if wanted is None or station.dataset_id in wanted:
+                    station_cities.setdefault(station.dataset_id, city)
+                station = navigator.next()
+
+        return station_cities
+
+    def _write_station(self, out_dir: str, station_id: str, station_data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Écrit le fichier d'une station.
+
+        Returns:
+            Dict[str, Any]: La description du fichier pour le manifeste.
+        """
+        if self.file_format == "memmap":
+            return self._write_station_arrays(out_dir, station_id, station_data)
+
+        file_name = f"{station_id}.{self.file_format}"
+        path = os.path.join(out_dir, file_name)
+
+        if self.file_format == "csv":
+            station_data.to_csv(f"{path}.tmp", index=False)
+            os.replace(f"{path}.tmp", path)
+        else:
+            write_frame(station_data, path, self.file_format)
+
+        return {
+            "status": "ok",
+            "file": file_name,
+            "rows": len(station_data),
+            "columns": [str(column) for column in station_data.columns],
+            "bytes": os.path.getsize(path)
+        }
+
+    def _write_station_arrays(self, out_dir: str, station_id: str, station_data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Écrit le dossier de tableaux binaires d'une station. Une station sans
+        relevé horodaté (ex: jeu de données d'information) n'a pas de dossier.
+
+        Returns:
+            Dict[str, Any]: La description du dossier pour le manifeste.
+        """
+        timestamp_col = self.data_service.extractor.timestamp_col
+        if station_data.empty or timestamp_col not in station_data.columns:
+            return {"status": "empty", "rows": 0}
+
+        directory = os.path.join(out_dir, station_id)
+        meta = write_measurement_arrays(station_data, directory, timestamp_col, self.measure_columns)
+
+        generation_dir = os.path.join(directory, meta["generation"])
+        return {
+            "status": "ok",
+            "file": station_id,
+            "rows": meta["rows"],
+            "columns": [meta["timestamp"]["name"]] + [spec["name"] for spec in meta["columns"]],
+            "bytes": sum(entry.stat().st_size for entry in os.scandir(generation_dir))
+        }
@@ -0,0 +1,92 @@
+"""Construction d'un panel de stations alignées sur une grille temporelle commune."""
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+from ..models.station_panel import StationPanel
+
+
+class StationPanelBuilder:
+    """
+    Aligne les relevés de plusieurs stations sur une grille régulière.
+
+    Chaque instant de la grille reçoit le relevé le plus proche de chaque station
+    (`merge_asof`, direction 'nearest'), à condition qu'il soit dans la tolérance ;
+    sinon la valeur est manquante. Les stations ne relèvent pas toutes aux mêmes
+    minutes : la grille permet de les comparer instant par instant.
+    """
+
+    def __init__(
+        self,
+        timestamp_col: str,
+        value_columns: List[str],
+        frequency: str = "15min",
+        tolerance: str = "10min"
+    ):
+        """
+        Initialise le constructeur.
+
+        Args:
+            timestamp_col (str): Colonne des horodatages (texte ISO ou datetime).
+            value_columns (List[str]): Mesures alignées (température, humidité, pression...).
+            frequency (str): Pas de la grille (règle pandas, ex: '15min', 'h').
+            tolerance (str): Écart maximal entre un instant de la grille et le relevé retenu.
+        """
+        self.timestamp_col = timestamp_col
+        self.value_columns = value_columns
+        self.frequency = frequency
+        self.tolerance = pd.Timedelta(tolerance)
+
+    def build(self, city: str, frames: Dict[str, pd.DataFrame]) -> StationPanel:
+        """
+        Construit le panel d'une ville.
+
+        Args:
+            city (str): Le nom de la ville.
+            frames (Dict[str, DataFrame]): Identifiant de station -> relevés. Les
+                stations sans relevé exploitable sont écartées.
+
+        Returns:
+            StationPanel: Les mesures alignées ; la grille couvre du plus ancien au
+                          plus récent relevé, toutes stations confondues.
+        """
+        readings = {station_id: self._prepare(df) for station_id, df in frames.items()}
+        readings = {station_id: df for station_id, df in readings.items() if not df.empty}
+        if not readings:
+            return StationPanel(city, pd.DatetimeIndex([], tz="UTC"), [], {})
+
+        start = min(df[self.timestamp_col].iloc[0] for df in readings.values())
+        end = max(df[self.timestamp_col].iloc[-1] for df in readings.values())
+        times = pd.date_range(start.round(self.frequency), end.round(self.frequency), freq=self.frequency)
+        grid = pd.DataFrame({self.timestamp_col: times})
+
+        station_ids = list(readings)
+        values = {
+            variable: np.full((len(times), len(station_ids)), np.nan) for variable in self.value_columns
+        }
+        for position, station_id in enumerate(station_ids):
+            aligned = pd.merge_asof(
+                grid, readings[station_id], on=self.timestamp_col,
+                direction="nearest", tolerance=self.tolerance
+            )
+            for variable in self.value_columns:
+                if variable in aligned.columns:
+                    values[variable][:, position] = aligned[variable].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        return StationPanel(city, times, station_ids, values)
+
+    def _prepare(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Garde l'horodatage (en UTC) et les mesures numériques, triés par date,
+        un seul relevé par horodatage.
+        """
+        if df.empty or self.timestamp_col not in df.columns:
+            return pd.DataFrame()
+
+        values = [col for col in self.value_columns if col in df.columns]
+        frame = pd.DataFrame({self.timestamp_col: pd.to_datetime(df[self.timestamp_col], utc=True)})
+        for column in values:
+            frame[column] = pd.to_numeric(df[column], errors="coerce").astype(np.float64)
+
+        frame = frame.dropna(subset=[self.timestamp_col])
+        frame = frame.drop_duplicates(subset=self.timestamp_col, keep="first")
+        return frame.sort_values(self.timestamp_col, kind="stable").reset_index(drop=True)
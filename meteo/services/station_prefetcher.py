@@ -0,0 +1,90 @@
+"""Chargement spéculatif, en arrière-plan, des stations voisines de la station affichée."""
+import threading
+import pandas as pd
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional
+
+
+class StationPrefetcher:
+    """
+    Charge en arrière-plan les stations que l'utilisateur a de bonnes chances
+    de consulter ensuite (typiquement la précédente et la suivante).
+
+    Une demande pour une station en cours de chargement attend ce chargement au
+    lieu d'en relancer un. Un résultat ne sert qu'une fois : seuls les
+    chargements en cours ou pas encore consommés sont conservés, et les
+    consultations suivantes passent par la fonction de chargement (cache,
+    durée de vie, rafraîchissement). Les chargements qui ne concernent plus le
+    voisinage courant sont abandonnés.
+    """
+
+    def __init__(self, load: Callable[[str], pd.DataFrame], max_workers: int = 2):
+        """
+        Initialise le préchargeur.
+
+        Args:
+            load (Callable[[str], DataFrame]): Fonction de chargement d'une station
+                                               (ex: WeatherDataService.get_station_data).
+            max_workers (int): Nombre de stations chargées simultanément.
+        """
+        self.load = load
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="station-prefetch")
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def prefetch(self, station_ids: Iterable[str]) -> None:
+        """
+        Lance le chargement des stations qui ne sont pas déjà en cours. Un
+        chargement terminé mais jamais consommé est relancé, pour ne pas servir
+        des données plus anciennes que la dernière navigation.
+
+        Args:
+            station_ids (Iterable[str]): Les identifiants des stations à précharger.
+        """
+        with self._lock:
+            for station_id in station_ids:
+                future = self._futures.get(station_id)
+                if future is None or future.done():
+                    self._futures[station_id] = self._executor.submit(self.load, station_id)
+
+    def retain(self, station_ids: Iterable[str]) -> None:
+        """
+        Abandonne les préchargements des stations absentes de la liste : ceux qui
+        n'ont pas démarré sont annulés, les autres sont oubliés.
+
+        Args:
+            station_ids (Iterable[str]): Les stations dont le préchargement est conservé.
+        """
+        keep = set(station_ids)
+        with self._lock:
+            for station_id in [sid for sid in self._futures if sid not in keep]:
+                self._futures.pop(station_id).cancel()
+
+    def get(self, station_id: str) -> Optional[pd.DataFrame]:
+        """
+        Retourne les données préchargées d'une station, en attendant la fin de
+        son chargement s'il est en cours. Le préchargement est alors consommé.
+
+        Args:
+            station_id (str): L'identifiant de la station.
+
+        Returns:
+            Optional[DataFrame]: Les données, ou None si la station n'a pas été
+                                 préchargée ou si son chargement a échoué.
+        """
+        with self._lock:
+            future = self._futures.pop(station_id, None)
+        if future is None or future.cancelled():
+            return None
+
+        try:
+            return future.result()
+        except Exception:
+            # Échec du préchargement : l'appelant se rabat sur un chargement direct
+            return None
+
+    def close(self) -> None:
+        """Annule les préchargements en attente et libère le pool de threads."""
+        with self._lock:
+            self._futures.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,83 @@
+"""Registre compact des stations du catalogue, partagé par les navigateurs."""
+import sys
+from typing import Dict, List, Optional, Tuple
+from ..models.station import Station
+
+
+class StationRegistry:
+    """
+    Conserve une instance unique de chaque station, identifiée par un petit
+    entier (sa position dans le registre).
+
+    Les navigateurs et les index ne stockent que ces entiers et partagent les
+    mêmes objets Station : rien n'est réalloué lorsqu'une ville est revisitée,
+    et les noms de ville sont internés (une seule chaîne par ville).
+
+    Une station est identifiée par le couple (identifiant, ville) : le filtre de
+    ville procédant par sous-chaîne, une même station peut appartenir à plusieurs
+    villes (ex: 'Toulouse' et 'Toulouse Métropole'), et chacune garde sa ville.
+    """
+
+    def __init__(self):
+        """Initialise un registre vide."""
+        self._stations: List[Station] = []
+        self._indices: Dict[Tuple[str, str], int] = {}
+
+    def get_or_create(self, dataset_id: str, city: str) -> int:
+        """
+        Retourne l'index d'une station dans une ville, en l'enregistrant si elle est nouvelle.
+
+        Args:
+            dataset_id (str): L'identifiant de la station.
+            city (str): Le nom de la ville (interné).
+
+        Returns:
+            int: L'index de la station dans le registre.
+        """
+        index = self._indices.get((dataset_id, str(city)))
+        if index is None:
+            index = self._append(Station(sys.intern(dataset_id), sys.intern(str(city))))
+        return index
+
+    def register(self, station: Station) -> int:
+        """
+        Enregistre une station existante (ou retrouve celle de même identifiant et même ville).
+
+        Args:
+            station (Station): La station à enregistrer.
+
+        Returns:
+            int: L'index de la station dans le registre.
+        """
+        index = self._indices.get((station.dataset_id, station.city))
+        if index is None:
+            index = self._append(station)
+        return index
+
+    def _append(self, station: Station) -> int:
+        """Ajoute une station en fin de registre et retourne son index."""
+        index = len(self._stations)
+        self._stations.append(station)
+        self._indices[(station.dataset_id, station.city)] = index
+        return index
+
+    def index_of(self, dataset_id: str, city: str) -> Optional[int]:
+        """
+        Retourne l'index d'une station dans une ville.
+
+        Args:
+            dataset_id (str): L'identifiant de la station.
+            city (str): Le nom de la ville.
+
+        Returns:
+            Optional[int]: L'index, ou None si la station n'est pas enregistrée.
+        """
+        return self._indices.get((dataset_id, city))
+
+    def __getitem__(self, index: int) -> Station:
+        """Permet d'accéder à une station par son index (registry[3])."""
+        return self._stations[index]
+
+    def __len__(self) -> int:
+        """Permet d'utiliser len(registry) pour obtenir le nombre de stations."""
+        return len(self._stations)
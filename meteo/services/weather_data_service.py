@@ -1,11 +1,22 @@
 """ Service de façade pour simplifier l'accès et le traitement des données météo."""
+import threading
+import time
+import requests
 import pandas as pd
-from typing import List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import List, Optional, Iterator, Any, Dict, Iterable
 from ..interfaces.base_interfaces import DataLoader, DataFilter, ParameterizedDataLoader
 from ..extractors.data_extractor import DataExtractor
-from ..models.station import Station
+from ..models.station_fetch_result import StationFetchResult
 from ..interfaces.navigation_interface import StationNavigator
+from ..models.station import Station
+from ..models.station_panel import StationPanel
 from ..factories.station_navigator_factory import StationNavigatorFactory
+from ..storage.catalog_snapshot import CatalogSnapshotStore
+from ..storage.dataframe_cache import DataFrameCache
+from ..storage.time_series_store import StationTimeSeriesStore
+from .catalog_index import CatalogIndex
+from .station_panel_builder import StationPanelBuilder
 
 
 class WeatherDataService:
@@ -22,7 +33,17 @@ class WeatherDataService:
         city_filter_factory,
         column_filter: DataFilter,
         extractor: DataExtractor,
-        navigator_factory: StationNavigatorFactory
+        navigator_factory: StationNavigatorFactory,
+        catalog_snapshot: Optional[CatalogSnapshotStore] = None,
+        station_dtype_filter: Optional[DataFilter] = None,
+        max_workers: int = 8,
+        station_timeout: Optional[float] = None,
+        station_cache: Optional[DataFrameCache] = None,
+        incremental_refresh: bool = False,
+        panel_builder: Optional[StationPanelBuilder] = None,
+        time_series_store: Optional[StationTimeSeriesStore] = None,
+        store_window: str = "1D",
+        offline: bool = False
     ):
         """
         Initialise le service avec toutes les dépendances nécessaires.
@@ -34,6 +55,29 @@ class WeatherDataService:
             city_filter_factory: Une fonction ou classe capable de créer un filtre de ville
             column_filter: Filtre pour sélectionner les colonnes utiles des données de station.
             extractor: Extracteur de données configuré.
+            navigator_factory: Factory des navigateurs de stations.
+            catalog_snapshot: Stockage optionnel du catalogue déjà filtré, réutilisé
+                              tant que la source et les filtres sont inchangés.
+            station_dtype_filter: Filtre optionnel appliqué après column_filter aux
+                                  données de station (types compacts, horodatages parsés).
+            max_workers: Nombre de stations chargées simultanément lors d'un chargement groupé.
+            station_timeout: Durée maximale (s) du chargement d'une station lors d'un
+                             chargement groupé (illimitée si None).
+            station_cache: Cache mémoire optionnel (LRU, durée de vie, budget d'octets)
+                           des données de station déjà filtrées.
+            incremental_refresh: Si True, une station dont l'entrée en cache a expiré
+                                 n'est complétée que des relevés postérieurs au plus
+                                 récent déjà connu.
+            panel_builder: Constructeur optionnel des panels de stations alignées
+                           (voir get_city_panel()).
+            time_series_store: Historique local optionnel des relevés. S'il est
+                               configuré, les données d'une station en sont lues et
+                               seuls les relevés postérieurs au plus récent stocké
+                               sont demandés à l'API, puis ajoutés à l'historique.
+            store_window: Période servie depuis l'historique local, en remontant
+                          depuis le relevé le plus récent (règle pandas, ex: '1D').
+            offline: Si True (avec time_series_store), l'API n'est jamais interrogée
+                     pour les données de station : seul l'historique local est lu.
         """
         self.catalog_loader = catalog_loader
         self.station_loader = station_loader
@@ -42,49 +86,527 @@ class WeatherDataService:
         self.city_filter_factory = city_filter_factory
         self.column_filter = column_filter
         self.extractor = extractor
+        self.catalog_snapshot = catalog_snapshot
+        self.station_dtype_filter = station_dtype_filter
+        self.max_workers = max_workers
+        self.station_timeout = station_timeout
+        self.station_cache = station_cache
+        self.incremental_refresh = incremental_refresh
+        self.panel_builder = panel_builder
+        self.time_series_store = time_series_store
+        self.store_window = pd.Timedelta(store_window)
+        self.offline = offline
+        # Horodatage du relevé le plus récent connu, par station
+        self._newest_timestamps: Dict[str, pd.Timestamp] = {}
         self.processed_catalog: Optional[pd.DataFrame] = None
+        self._catalog_index: Optional[CatalogIndex] = None
+        # Un seul chargement du catalogue (et construction de l'index) à la fois,
+        # même si plusieurs threads le demandent ensemble au démarrage
+        self._catalog_lock = threading.Lock()
 
     def get_processed_catalog(self) -> pd.DataFrame:
         """
         Charge et filtre le catalogue des stations météo.
-        Met en cache le résultat pour éviter de le recharger.
+        Met en cache le résultat pour éviter de le recharger. Les appels
+        simultanés attendent le chargement en cours au lieu d'en lancer un autre.
         """
         # Mise en cache simple pour ne pas recharger à chaque fois
-        if self.processed_catalog is None:
-            raw_catalog = self.catalog_loader.load_data()
-            if raw_catalog.empty:
-                self.processed_catalog = pd.DataFrame()
-            else:
-                self.processed_catalog = self.catalog_filter.filter(raw_catalog)
+        catalog = self.processed_catalog
+        if catalog is None:
+            with self._catalog_lock:
+                if self.processed_catalog is None:
+                    self.processed_catalog = self._load_processed_catalog()
+                catalog = self.processed_catalog
+
+        return catalog
+
+    def _load_processed_catalog(self) -> pd.DataFrame:
+        """
+        Construit le catalogue traité, depuis l'instantané disque s'il correspond
+        à la version courante de la source et aux filtres configurés.
+        """
+        predicate_kwargs = self._get_predicate_kwargs()
+
+        snapshot_key = None
+        if self.catalog_snapshot is not None:
+            source_version = self.catalog_loader.get_source_version(**predicate_kwargs)
+            if source_version is not None:
+                snapshot_key = self.catalog_snapshot.make_key(source_version, self.catalog_filter.describe())
+                snapshot = self.catalog_snapshot.load(snapshot_key)
+                if snapshot is not None:
+                    return snapshot
+
+        raw_catalog = self.catalog_loader.load_data(**predicate_kwargs)
+        # Catalogue injoignable (None) ou vide : chargement en échec
+        if raw_catalog is None or raw_catalog.empty:
+            return pd.DataFrame()
+
+        processed_catalog = self.catalog_filter.filter(raw_catalog)
+        if snapshot_key is not None:
+            self.catalog_snapshot.save(snapshot_key, processed_catalog)
+
+        return processed_catalog
+
+    def _get_predicate_kwargs(self) -> dict:
+        """
+        Prépare les prédicats du pipeline de catalogue à déléguer au loader, si
+        celui-ci les prend en charge. Le pipeline complet reste appliqué localement.
+        """
+        if not self.catalog_loader.supports_predicates:
+            return {}
+        predicates = self.catalog_filter.get_server_predicates()
+        return {"predicates": predicates} if predicates else {}
+
+    def invalidate_catalog(self) -> None:
+        """
+        Oublie le catalogue en mémoire : il sera rechargé (et l'index reconstruit)
+        au prochain accès.
+        """
+        with self._catalog_lock:
+            self.processed_catalog = None
+            self._catalog_index = None
 
-        return self.processed_catalog
+    def _get_catalog_index(self) -> CatalogIndex:
+        """
+        Retourne l'index du catalogue courant, reconstruit automatiquement si le
+        catalogue a changé depuis sa construction.
+        """
+        catalog = self.get_processed_catalog()
+        catalog_index = self._catalog_index
+        if catalog_index is None or catalog_index.source is not catalog:
+            with self._catalog_lock:
+                if self._catalog_index is None or self._catalog_index.source is not catalog:
+                    self._catalog_index = CatalogIndex(
+                        catalog,
+                        self.extractor,
+                        self.city_filter_factory,
+                        station_sort_key=self.navigator_factory.get_sort_keys
+                    )
+                catalog_index = self._catalog_index
+        return catalog_index
 
     def get_cities(self) -> List[str]:
         """Récupère la liste des villes depuis le catalogue filtré."""
-        catalog = self.get_processed_catalog()
-        return self.extractor.get_unique_cities(catalog)
+        return self._get_catalog_index().get_cities()
+
+    def get_station_metadata(self, station_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Récupère les informations du catalogue pour une station.
+
+        Returns:
+            Optional[Dict[str, Any]]: Les colonnes du catalogue, ou None si la station est inconnue.
+        """
+        return self._get_catalog_index().get_station_metadata(station_id)
 
     def get_stations_for_city(self, city_name: str) -> StationNavigator:
         """Récupère un navigateur de stations pour une ville donnée."""
-        catalog = self.get_processed_catalog()
-        city_filter = self.city_filter_factory(city_name)
+        catalog_index = self._get_catalog_index()
+        stations = catalog_index.get_stations(city_name)
+        # Les stations indexées sont déjà dans l'ordre de navigation
+        presorted = stations is not None
 
-        city_specific_catalog = city_filter.filter(catalog)
+        if stations is None:
+            stations = self._find_city_stations(city_name)
+
+        # Utiliser la factory pour créer le navigateur
+        return self.navigator_factory.create_from_station_list(
+            stations,
+            registry=catalog_index.registry,
+            presorted=presorted
+        )
+
+    def _find_city_stations(self, city_name: str) -> List[Station]:
+        """Recherche directe dans le catalogue, pour une ville absente de l'index (saisie libre)."""
+        city_filter = self.city_filter_factory(city_name)
+        city_specific_catalog = city_filter.filter(self.get_processed_catalog())
         station_ids = self.extractor.get_unique_stations(city_specific_catalog)
+        # Les stations déjà connues du registre sont réutilisées telles quelles
+        registry = self._get_catalog_index().registry
+        return [registry[registry.get_or_create(station_id, city_name)] for station_id in station_ids]
 
-        # Créer des objets Station à partir des IDs
-        stations = [Station(station_id, city_name) for station_id in station_ids]
+    def fetch_city_station_data(
+        self,
+        city_name: str,
+        max_workers: Optional[int] = None,
+        station_timeout: Optional[float] = None
+    ) -> Iterator[StationFetchResult]:
+        """
+        Charge simultanément les données de toutes les stations d'une ville.
+        Voir fetch_stations_data().
+        """
+        return self.fetch_stations_data(
+            self._get_city_station_ids(city_name),
+            max_workers=max_workers,
+            station_timeout=station_timeout
+        )
 
-        # Utiliser la factory pour créer le navigateur
-        return self.navigator_factory.create_from_station_list(stations)
+    def get_city_panel(self, city_name: str) -> StationPanel:
+        """
+        Charge simultanément les stations d'une ville et aligne leurs relevés sur
+        une grille temporelle commune, pour les comparer instant par instant.
+        Les stations en échec ou sans données sont écartées du panel.
+
+        Args:
+            city_name (str): Le nom de la ville.
+
+        Returns:
+            StationPanel: Une colonne par station et par mesure.
 
-    def get_station_data(self, station_id: str) -> pd.DataFrame:
+        Raises:
+            ValueError: Si aucun constructeur de panel n'est configuré.
+        """
+        if self.panel_builder is None:
+            raise ValueError("Aucun constructeur de panel n'est configuré.")
+
+        frames = {result.station_id: result.data for result in self.fetch_city_station_data(city_name) if result.ok}
+        # Colonnes dans l'ordre de navigation, quel que soit l'ordre d'arrivée
+        station_ids = [station_id for station_id in self._get_city_station_ids(city_name) if station_id in frames]
+        return self.panel_builder.build(city_name, {station_id: frames[station_id] for station_id in station_ids})
+
+    def _get_city_station_ids(self, city_name: str) -> List[str]:
+        """Identifiants des stations d'une ville, dans l'ordre de navigation."""
+        stations = self._get_catalog_index().get_stations(city_name)
+        if stations is None:
+            stations = self._find_city_stations(city_name)
+        return [station.dataset_id for station in stations]
+
+    def fetch_stations_data(
+        self,
+        station_ids: Iterable[str],
+        max_workers: Optional[int] = None,
+        station_timeout: Optional[float] = None,
+        raise_errors: bool = False,
+        history: bool = False
+    ) -> Iterator[StationFetchResult]:
+        """
+        Charge les données de plusieurs stations à travers un pool de threads borné
+        et les retourne au fil de leur arrivée.
+
+        Une station en erreur ou dont le chargement dépasse station_timeout produit
+        un résultat en échec, sans interrompre les autres. Le nombre de requêtes
+        simultanées vers un même hôte reste borné par le client HTTP.
+
+        Args:
+            station_ids (Iterable[str]): Les identifiants des stations.
+            max_workers (Optional[int]): Taille du pool (défaut : self.max_workers).
+            station_timeout (Optional[float]): Délai par station, mesuré à partir du
+                début de son chargement (défaut : self.station_timeout).
+            raise_errors (bool): Si True, une station dont l'API est injoignable
+                produit un résultat en échec au lieu de données vides
+                (voir get_station_data()).
+            history (bool): Si True, charge l'historique complet de chaque station
+                (voir get_station_history()) au lieu de ses derniers relevés ; une
+                erreur réseau produit alors toujours un résultat en échec.
+
+        Yields:
+            StationFetchResult: Un résultat par station, dans l'ordre d'arrivée.
+        """
+        station_ids = list(dict.fromkeys(station_ids))
+        if not station_ids:
+            return
+
+        timeout = self.station_timeout if station_timeout is None else station_timeout
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.max_workers,
+            thread_name_prefix="station-fetch"
+        )
+        # Début effectif du chargement de chaque station (une fois un thread disponible)
+        started_at: Dict[str, float] = {}
+
+        def load(station_id: str) -> pd.DataFrame:
+            started_at[station_id] = time.monotonic()
+            if history:
+                return self.get_station_history(station_id)
+            return self.get_station_data(station_id, raise_errors=raise_errors)
+
+        pending: Dict[Future, str] = {
+            executor.submit(load, station_id): station_id for station_id in station_ids
+        }
+
+        try:
+            while pending:
+                done, _ = wait(pending, timeout=self._get_wait_timeout(pending, started_at, timeout),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    station_id = pending.pop(future)
+                    try:
+                        yield StationFetchResult(station_id, data=future.result())
+                    except Exception as e:
+                        yield StationFetchResult(station_id, error=e)
+
+                if timeout is None:
+                    continue
+
+                now = time.monotonic()
+                for future, station_id in list(pending.items()):
+                    started = started_at.get(station_id)
+                    if started is not None and now - started >= timeout:
+                        # Le thread ne peut pas être interrompu : son résultat sera ignoré
+                        del pending[future]
+                        yield StationFetchResult(
+                            station_id,
+                            error=TimeoutError(f"Délai dépassé ({timeout} s) pour la station {station_id}")
+                        )
+        finally:
+            # Arrêt sans attendre : les stations non démarrées sont annulées
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _get_wait_timeout(
+        pending: Dict[Future, str],
+        started_at: Dict[str, float],
+        timeout: Optional[float]
+    ) -> Optional[float]:
+        """Calcule l'attente maximale avant la prochaine échéance d'une station en cours."""
+        if timeout is None:
+            return None
+
+        now = time.monotonic()
+        remaining = [
+            started_at[station_id] + timeout - now
+            for station_id in pending.values() if station_id in started_at
+        ]
+        return max(0.0, min(remaining)) if remaining else timeout
+
+    def _get_projection_kwargs(self) -> dict:
+        """
+        Prépare la projection à déléguer au loader de stations, si celui-ci la
+        prend en charge. Le filtre de colonnes reste appliqué localement ensuite.
+        """
+        if not self.station_loader.supports_projection:
+            return {}
+        columns = self.column_filter.get_projection()
+        return {"columns": columns} if columns else {}
+
+    def get_station_data(self, station_id: str, raise_errors: bool = False) -> pd.DataFrame:
         """
         Charge et filtre les données pour une station unique.
         Retourne un DataFrame avec uniquement les colonnes utiles.
+        Les colonnes sont demandées directement à l'API quand c'est possible.
+        Une station consultée récemment est servie depuis le cache, s'il est configuré.
+        Avec un historique local, les données en sont lues après l'avoir complété
+        des derniers relevés de l'API.
+
+        Par défaut, une erreur réseau produit un DataFrame vide (ou les données
+        déjà connues). Avec raise_errors=True, elle est propagée : un appelant
+        sans interface (export planifié) peut ainsi distinguer une panne de
+        l'API d'une station sans relevé.
+
+        Raises:
+            RequestException: Avec raise_errors, si l'API est injoignable ou répond en erreur.
         """
-        raw_station_data = self.station_loader.load_data(station_id)
+        if self.station_cache is not None:
+            cached = self.station_cache.get(station_id)
+            if cached is not None:
+                # Copie : l'appelant peut modifier le résultat sans altérer le cache
+                return cached.copy()
+
+            if self.incremental_refresh and self.time_series_store is None:
+                stale = self.station_cache.get_stale(station_id)
+                if stale is not None and station_id in self._newest_timestamps:
+                    return self._refresh_from(station_id, stale, raise_errors=raise_errors)
+
+        if self.time_series_store is not None:
+            station_data = self._load_through_store(station_id, raise_errors=raise_errors)
+        else:
+            station_data = self._load_from_network(station_id, raise_errors=raise_errors)
+
+        if station_data.empty:
+            return pd.DataFrame()
+
+        self._store_station_data(station_id, station_data)
+        return station_data
+
+    def _load_from_network(self, station_id: str, raise_errors: bool = False) -> pd.DataFrame:
+        """Charge les derniers relevés d'une station depuis l'API et les filtre."""
+        raw_station_data = self.station_loader.load_data(
+            station_id, raise_errors=raise_errors, **self._get_projection_kwargs()
+        )
         if raw_station_data.empty:
             return pd.DataFrame()
+        return self._process_station_data(raw_station_data)
+
+    def _load_through_store(self, station_id: str, raise_errors: bool = False) -> pd.DataFrame:
+        """
+        Complète l'historique local d'une station depuis l'API (sauf hors ligne),
+        puis en lit la période la plus récente, du relevé le plus récent au plus ancien.
+        En cas d'erreur réseau, l'historique déjà stocké est servi tel quel
+        (sauf avec raise_errors).
+        """
+        newest = self.time_series_store.get_newest_timestamp(station_id)
+
+        if not self.offline:
+            if newest is None:
+                self.time_series_store.append(station_id, self._load_from_network(station_id, raise_errors))
+            else:
+                try:
+                    for chunk in self.iter_station_data(station_id, since=newest):
+                        self.time_series_store.append(station_id, chunk)
+                except requests.exceptions.RequestException:
+                    if raise_errors:
+                        raise
+            newest = self.time_series_store.get_newest_timestamp(station_id)
+
+        if newest is None:
+            return pd.DataFrame()
+
+        station_data = self.time_series_store.query(station_id, since=newest - self.store_window)
+        return station_data.iloc[::-1].reset_index(drop=True)
+
+    def get_station_history(self, station_id: str) -> pd.DataFrame:
+        """
+        Retourne tout l'historique d'une station, limité aux colonnes utiles.
+
+        Avec un historique local, celui-ci est d'abord complété depuis l'API des
+        relevés postérieurs au plus récent stocké (tout l'historique s'il est vide,
+        rien hors ligne), puis lu en entier. Sans historique local, l'historique
+        complet est téléchargé par blocs.
+
+        Args:
+            station_id (str): ID de la station.
+
+        Returns:
+            DataFrame: Les relevés (vide si la station n'en a aucun).
+
+        Raises:
+            RequestException: Si l'API est injoignable ou répond en erreur.
+        """
+        if self.time_series_store is None:
+            chunks = list(self.iter_station_data(station_id))
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+        if not self.offline:
+            newest = self.time_series_store.get_newest_timestamp(station_id)
+            for chunk in self.iter_station_data(station_id, since=newest):
+                self.time_series_store.append(station_id, chunk)
+        return self.time_series_store.query(station_id)
+
+    def get_cached_station_data(self, station_id: str) -> Optional[pd.DataFrame]:
+        """
+        Retourne les données d'une station si elles sont en cache et à jour,
+        sans chargement ni copie : le DataFrame renvoyé ne doit pas être modifié.
+
+        Args:
+            station_id (str): ID de la station.
+
+        Returns:
+            Optional[DataFrame]: Les données en cache, ou None.
+        """
+        if self.station_cache is None:
+            return None
+        return self.station_cache.get(station_id)
+
+    def refresh_station_data(self, station_id: str) -> pd.DataFrame:
+        """
+        Complète les données d'une station avec les seuls relevés postérieurs au
+        plus récent déjà connu, même si l'entrée en cache n'a pas expiré.
+        Sans données antérieures, la station est chargée normalement.
+        Avec un historique local, c'est lui qui est complété puis relu.
+
+        Args:
+            station_id (str): ID de la station.
+
+        Returns:
+            DataFrame: Les données à jour, du relevé le plus récent au plus ancien.
+        """
+        if self.time_series_store is not None:
+            station_data = self._load_through_store(station_id)
+            if not station_data.empty:
+                self._store_station_data(station_id, station_data)
+            return station_data
+
+        stale = None if self.station_cache is None else self.station_cache.get_stale(station_id)
+        if stale is None or station_id not in self._newest_timestamps:
+            return self.get_station_data(station_id)
+        return self._refresh_from(station_id, stale)
+
+    def _refresh_from(self, station_id: str, known_data: pd.DataFrame, raise_errors: bool = False) -> pd.DataFrame:
+        """
+        Télécharge les relevés à partir du plus récent connu (clause `where` sur
+        l'horodatage) et les fusionne aux données connues.
+        En cas d'erreur réseau, les données connues sont renvoyées telles quelles
+        (sauf avec raise_errors).
+        """
+        try:
+            new_chunks = list(self.iter_station_data(station_id, since=self._newest_timestamps[station_id]))
+        except requests.exceptions.RequestException:
+            if raise_errors:
+                raise
+            return known_data.copy()
+
+        station_data = self._merge_station_data(new_chunks, known_data)
+        self._store_station_data(station_id, station_data)
+        return station_data
+
+    def _merge_station_data(self, new_chunks: List[pd.DataFrame], known_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fusionne de nouveaux relevés aux données connues : dédoublonnage vectorisé
+        sur l'horodatage (le relevé le plus récent l'emporte), puis tri décroissant.
+        """
+        if not new_chunks:
+            return known_data.copy()
+
+        timestamp_col = self.extractor.timestamp_col
+        merged = pd.concat(new_chunks + [known_data], ignore_index=True)
+        timestamps = pd.to_datetime(merged[timestamp_col], utc=True)
+
+        keep = ~timestamps.duplicated(keep="first")
+        order = timestamps[keep].sort_values(ascending=False, kind="stable").index
+        return merged.loc[order].reset_index(drop=True)
+
+    def _store_station_data(self, station_id: str, station_data: pd.DataFrame) -> None:
+        """Met en cache les données d'une station et retient son relevé le plus récent."""
+        if self.station_cache is None:
+            return
+
+        self.station_cache.put(station_id, station_data.copy())
+
+        timestamp_col = self.extractor.timestamp_col
+        if self.incremental_refresh and timestamp_col in station_data.columns:
+            newest = pd.to_datetime(station_data[timestamp_col], utc=True).max()
+            if pd.notna(newest):
+                self._newest_timestamps[station_id] = newest
+
+    def get_station_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Retourne les statistiques du cache des données de station.
+
+        Returns:
+            Optional[Dict[str, Any]]: Succès, échecs, entrées et octets, ou None sans cache.
+        """
+        if self.station_cache is None:
+            return None
+        return self.station_cache.get_stats()
+
+    def iter_station_data(
+        self,
+        station_id: str,
+        since: Optional[Any] = None,
+        until: Optional[Any] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Parcourt l'historique complet d'une station par blocs filtrés,
+        sans jamais le charger entièrement en mémoire.
+
+        Args:
+            station_id (str): ID de la station.
+            since (Optional[Any]): Début de période inclus (str, datetime ou Timestamp).
+            until (Optional[Any]): Fin de période incluse (str, datetime ou Timestamp).
+
+        Yields:
+            DataFrame: Un bloc d'enregistrements limité aux colonnes utiles.
+        """
+        chunks = self.station_loader.iter_data(
+            station_id, since=since, until=until, **self._get_projection_kwargs()
+        )
+        for chunk in chunks:
+            if not chunk.empty:
+                yield self._process_station_data(chunk)
 
-        return self.column_filter.filter(raw_station_data)
\ No newline at end of file
+    def _process_station_data(self, raw_station_data: pd.DataFrame) -> pd.DataFrame:
+        """Applique le filtre de colonnes puis, s'il est configuré, l'optimisation des types."""
+        station_data = self.column_filter.filter(raw_station_data)
+        if self.station_dtype_filter is not None:
+            station_data = self.station_dtype_filter.filter(station_data)
+        return station_data
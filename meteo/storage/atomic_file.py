@@ -0,0 +1,44 @@
+"""Écriture atomique de fichiers, sûre entre threads et processus concurrents."""
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import IO, Iterator
+
+# Masque de création courant, lu une fois à l'import (os.umask ne permet pas de le lire sans le modifier)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "wb", **kwargs) -> Iterator[IO]:
+    """
+    Ouvre un fichier temporaire unique dans le dossier de `path`, qui remplace
+    `path` à la sortie du bloc. En cas d'erreur, le fichier temporaire est
+    supprimé et `path` reste inchangé.
+
+    Chaque écriture a son propre fichier temporaire : deux écritures
+    simultanées du même chemin ne se marchent pas dessus, la dernière l'emporte.
+
+    Args:
+        path (str): Le chemin du fichier de destination.
+        mode (str): Mode d'ouverture ('wb' ou 'w').
+        **kwargs: Arguments transmis à `open` (ex: encoding).
+
+    Yields:
+        IO: Le fichier temporaire ouvert.
+    """
+    directory, name = os.path.split(path)
+    # Préfixe '.' : le fichier temporaire échappe aux motifs des nettoyages (ex: 'catalog-*')
+    fd, tmp_path = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.", suffix=".tmp")
+    try:
+        # mkstemp crée le fichier en 0600 : mêmes droits qu'un fichier ouvert normalement
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
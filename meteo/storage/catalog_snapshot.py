@@ -0,0 +1,88 @@
+"""Instantané binaire du catalogue traité, pour un démarrage sans parsing ni filtrage."""
+import glob
+import hashlib
+import json
+import os
+import pandas as pd
+from typing import Any, Optional
+from .columnar import read_frame, resolve_format, write_frame
+
+
+class CatalogSnapshotStore:
+    """
+    Conserve sur disque le catalogue *après* le pipeline de filtres, dans un
+    format colonnaire (npz ou parquet).
+
+    Un instantané est identifié par une clé dérivée de la version de la source
+    (validateur HTTP) et de la description des filtres appliqués : si l'un ou
+    l'autre change, l'instantané n'est plus utilisé.
+    """
+
+    def __init__(self, directory: str, file_format: str = "auto"):
+        """
+        Initialise le stockage des instantanés.
+
+        Args:
+            directory (str): Le dossier de stockage (créé si nécessaire).
+            file_format (str): 'npz', 'parquet' ou 'auto'.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.file_format = resolve_format(file_format)
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(source_version: str, filter_spec: Any) -> str:
+        """
+        Calcule la clé d'un instantané.
+
+        Args:
+            source_version (str): L'identifiant de version de la source brute.
+            filter_spec (Any): La description canonique (sérialisable) des filtres.
+
+        Returns:
+            str: Une empreinte hexadécimale stable.
+        """
+        payload = json.dumps(
+            {"source": source_version, "filters": filter_spec},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        """Retourne le chemin du fichier associé à une clé."""
+        return os.path.join(self.directory, f"catalog-{key}.{self.file_format}")
+
+    def load(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Charge l'instantané associé à une clé.
+
+        Args:
+            key (str): La clé calculée par `make_key`.
+
+        Returns:
+            Optional[DataFrame]: Le catalogue traité, ou None si absent ou illisible.
+        """
+        path = self._get_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            return read_frame(path, self.file_format)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Instantané du catalogue illisible, il sera reconstruit : {e}")
+            return None
+
+    def save(self, key: str, df: pd.DataFrame) -> None:
+        """
+        Enregistre le catalogue traité et supprime les instantanés obsolètes.
+
+        Args:
+            key (str): La clé calculée par `make_key`.
+            df (DataFrame): Le catalogue traité.
+        """
+        path = self._get_path(key)
+        write_frame(df, path, self.file_format)
+
+        for old_path in glob.glob(os.path.join(self.directory, "catalog-*")):
+            if old_path != path:
+                os.remove(old_path)
@@ -0,0 +1,176 @@
+"""
+Sérialisation colonnaire de DataFrames sans pickle.
+
+Deux formats sont pris en charge :
+- `npz` : une archive NumPy contenant un tableau par colonne (toujours disponible) ;
+- `parquet` : utilisé uniquement si `pyarrow` est installé.
+"""
+import json
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List, Mapping, Optional
+from .atomic_file import atomic_write
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+SUPPORTED_FORMATS = ("npz", "parquet")
+
+# Clé réservée de l'archive npz contenant la description des colonnes
+_META_KEY = "__meta__"
+
+
+def resolve_format(file_format: str = "auto") -> str:
+    """
+    Résout le format effectif de sérialisation.
+
+    Args:
+        file_format (str): 'npz', 'parquet' ou 'auto' (parquet si disponible, sinon npz).
+
+    Returns:
+        str: Le format effectif.
+
+    Raises:
+        ValueError: Si le format est inconnu.
+        ImportError: Si 'parquet' est demandé sans que pyarrow soit installé.
+    """
+    if file_format == "auto":
+        return "parquet" if PARQUET_AVAILABLE else "npz"
+    if file_format not in SUPPORTED_FORMATS:
+        raise ValueError(f"Format de fichier inconnu : '{file_format}'.")
+    if file_format == "parquet" and not PARQUET_AVAILABLE:
+        raise ImportError("Le format parquet nécessite le paquet 'pyarrow'.")
+    return file_format
+
+
+def write_frame(df: pd.DataFrame, path: str, file_format: str = "auto") -> str:
+    """
+    Écrit un DataFrame sur disque de manière atomique.
+
+    Args:
+        df (DataFrame): Le DataFrame à écrire.
+        path (str): Le chemin du fichier de destination (sans contrôle d'extension).
+        file_format (str): 'npz', 'parquet' ou 'auto'.
+
+    Returns:
+        str: Le format effectivement utilisé.
+    """
+    file_format = resolve_format(file_format)
+
+    with atomic_write(path, "wb") as f:
+        if file_format == "parquet":
+            df.to_parquet(f)
+        else:
+            np.savez(f, **_frame_to_arrays(df))
+
+    return file_format
+
+
+def read_frame(path: str, file_format: str = "auto", columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Lit un DataFrame écrit par `write_frame`.
+
+    Args:
+        path (str): Le chemin du fichier.
+        file_format (str): 'npz', 'parquet' ou 'auto'.
+        columns (Optional[List[str]]): Colonnes à lire (toutes si None). Les
+            autres colonnes ne sont pas décodées ; les colonnes absentes sont ignorées.
+
+    Returns:
+        DataFrame: Le DataFrame reconstruit.
+    """
+    if resolve_format(file_format) == "parquet":
+        if columns is None:
+            return pd.read_parquet(path)
+        import pyarrow.parquet as pq
+        available = set(pq.read_schema(path).names)
+        return pd.read_parquet(path, columns=[column for column in columns if column in available])
+
+    # Les tableaux d'une archive npz ne sont décompressés qu'à leur premier accès
+    with np.load(path, allow_pickle=False) as archive:
+        return _arrays_to_frame(archive, columns)
+
+
+def _frame_to_arrays(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Convertit un DataFrame en tableaux NumPy sans objets Python.
+    Les colonnes texte deviennent des tableaux unicode de largeur fixe
+    accompagnés d'un masque des valeurs manquantes.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    columns = []
+
+    for position, column in enumerate(df.columns):
+        key = f"c{position}"
+        series = df[column]
+        spec: Dict[str, Any] = {"name": column, "key": key}
+
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            spec["kind"] = "category"
+            arrays[key] = series.cat.codes.to_numpy()
+            arrays[f"{key}_categories"] = series.cat.categories.astype(str).to_numpy(dtype=str)
+        elif isinstance(series.dtype, pd.DatetimeTZDtype):
+            spec["kind"] = "datetime"
+            spec["tz"] = str(series.dt.tz)
+            arrays[key] = series.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy("datetime64[ns]").view("int64")
+        elif pd.api.types.is_datetime64_dtype(series.dtype):
+            spec["kind"] = "datetime"
+            arrays[key] = series.to_numpy("datetime64[ns]").view("int64")
+        elif pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            spec["kind"] = "numeric"
+            arrays[key] = series.to_numpy()
+        else:
+            spec["kind"] = "string"
+            mask = series.isna().to_numpy()
+            arrays[key] = series.where(~mask, "").astype(str).to_numpy(dtype=str)
+            arrays[f"{key}_mask"] = mask
+
+        columns.append(spec)
+
+    index = df.index
+    index_is_integer = pd.api.types.is_integer_dtype(index.dtype)
+    if index_is_integer:
+        arrays["__index__"] = index.to_numpy()
+
+    meta = {"columns": columns, "integer_index": index_is_integer}
+    arrays[_META_KEY] = np.array(json.dumps(meta))
+    return arrays
+
+
+def _arrays_to_frame(arrays: Mapping[str, np.ndarray], columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Reconstruit un DataFrame à partir des tableaux produits par `_frame_to_arrays`,
+    en ne lisant que les tableaux des colonnes demandées.
+    """
+    meta = json.loads(str(arrays[_META_KEY]))
+    specs = meta["columns"]
+    if columns is not None:
+        wanted = set(columns)
+        specs = [spec for spec in specs if spec["name"] in wanted]
+    data = {}
+
+    for spec in specs:
+        key = spec["key"]
+        values = arrays[key]
+
+        if spec["kind"] == "category":
+            data[spec["name"]] = pd.Categorical.from_codes(values, categories=arrays[f"{key}_categories"])
+        elif spec["kind"] == "datetime":
+            timestamps = pd.to_datetime(values.view("datetime64[ns]"))
+            if "tz" in spec:
+                timestamps = timestamps.tz_localize("UTC").tz_convert(spec["tz"])
+            data[spec["name"]] = timestamps
+        elif spec["kind"] == "string":
+            series = pd.Series(values, dtype=object)
+            series[arrays[f"{key}_mask"]] = np.nan
+            data[spec["name"]] = series.to_numpy()
+        else:
+            data[spec["name"]] = values
+
+    index = pd.Index(arrays["__index__"]) if meta["integer_index"] else None
+    column_names = [spec["name"] for spec in specs]
+    return pd.DataFrame(data, index=index, columns=column_names)
@@ -0,0 +1,155 @@
+"""Cache mémoire de DataFrames, borné en nombre d'entrées et en octets (LRU), avec durée de vie optionnelle."""
+import threading
+import time
+import pandas as pd
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class DataFrameCache:
+    """
+    Cache LRU de DataFrames.
+
+    La taille de chaque DataFrame est mesurée avec `memory_usage(deep=True)` ;
+    les entrées les moins récemment utilisées sont évincées dès que le budget
+    d'octets ou le nombre maximal d'entrées est dépassé. Avec une durée de vie
+    (ttl), une entrée trop ancienne est considérée comme absente par get(), mais
+    reste accessible via get_stale() jusqu'à son remplacement ou son éviction :
+    elle peut servir de base à un rafraîchissement incrémental. Le cache est
+    protégé par un verrou et peut être partagé entre plusieurs threads.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialise un cache vide.
+
+        Args:
+            max_bytes (int): Budget mémoire total des DataFrames conservés.
+            max_entries (Optional[int]): Nombre maximal d'entrées (illimité si None).
+            ttl (Optional[float]): Durée de vie d'une entrée en secondes (illimitée si None).
+        """
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """
+        Retourne le DataFrame associé à une clé et le marque comme récemment utilisé.
+
+        Args:
+            key (Hashable): La clé recherchée.
+
+        Returns:
+            Optional[DataFrame]: Le DataFrame en cache, ou None en cas d'absence
+                                 ou d'expiration.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= time.monotonic():
+                # Entrée expirée : comptée comme un échec, mais conservée pour get_stale()
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_stale(self, key: Hashable) -> Optional[pd.DataFrame]:
+        """
+        Retourne le DataFrame associé à une clé, même expiré, sans modifier les
+        compteurs ni l'ordre d'éviction.
+
+        Args:
+            key (Hashable): La clé recherchée.
+
+        Returns:
+            Optional[DataFrame]: Le DataFrame en cache, ou None s'il a été évincé.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[0]
+
+    def put(self, key: Hashable, df: pd.DataFrame) -> bool:
+        """
+        Ajoute (ou remplace) un DataFrame dans le cache.
+
+        Args:
+            key (Hashable): La clé associée.
+            df (DataFrame): Le DataFrame à conserver.
+
+        Returns:
+            bool: False si le DataFrame dépasse à lui seul le budget et n'a pas été conservé.
+        """
+        size = int(df.memory_usage(deep=True).sum())
+
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return False
+
+            expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+            self._entries[key] = (df, size, expires_at)
+            self._total_bytes += size
+            self._evict()
+            return True
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Retire une entrée du cache.
+
+        Args:
+            key (Hashable): La clé à retirer.
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques d'utilisation du cache.
+
+        Returns:
+            Dict[str, Any]: Succès, échecs (dont expirations), nombre d'entrées et octets occupés.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Retire une entrée (verrou déjà acquis)."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def _evict(self) -> None:
+        """Évince les entrées les plus anciennes tant que les limites sont dépassées (verrou déjà acquis)."""
+        while self._entries and (
+            self._total_bytes > self.max_bytes
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._total_bytes -= size
+
+    def __len__(self) -> int:
+        """Permet d'utiliser len(cache) pour obtenir le nombre d'entrées."""
+        return len(self._entries)
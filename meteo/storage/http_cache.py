@@ -0,0 +1,129 @@
+"""Cache disque des réponses HTTP avec revalidation par ETag / Last-Modified."""
+import hashlib
+import json
+import os
+import requests
+from typing import Dict, Optional, Any
+from .atomic_file import atomic_write
+
+
+class HttpResponseCache:
+    """
+    Conserve sur disque le corps des réponses HTTP ainsi que leurs validateurs
+    (`ETag`, `Last-Modified`).
+
+    Chaque URL est associée à deux fichiers : le corps brut et un fichier JSON
+    de métadonnées. Les validateurs permettent d'émettre des requêtes
+    conditionnelles ; une réponse 304 est alors servie directement depuis le disque.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialise le cache.
+
+        Args:
+            cache_dir (str): Le dossier de stockage (créé si nécessaire).
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _get_paths(self, url: str) -> tuple:
+        """
+        Calcule les chemins du corps et des métadonnées pour une URL.
+
+        Returns:
+            tuple: (chemin du corps, chemin des métadonnées).
+        """
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.body", f"{base}.json"
+
+    def _read_metadata(self, url: str) -> Optional[Dict[str, Any]]:
+        """Lit les métadonnées d'une URL, ou None si l'entrée est absente ou incomplète."""
+        body_path, meta_path = self._get_paths(url)
+        if not (os.path.exists(body_path) and os.path.exists(meta_path)):
+            return None
+        try:
+            with open(meta_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def get_conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Construit les en-têtes de requête conditionnelle pour une URL.
+
+        Args:
+            url (str): L'URL de la ressource.
+
+        Returns:
+            Dict[str, str]: Les en-têtes `If-None-Match` / `If-Modified-Since`
+                            (vide si aucune entrée n'est en cache).
+        """
+        metadata = self._read_metadata(url)
+        if metadata is None:
+            return {}
+
+        headers = {}
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+        return headers
+
+    def get_body_path(self, url: str) -> Optional[str]:
+        """
+        Retourne le chemin du corps en cache pour une URL.
+
+        Returns:
+            Optional[str]: Le chemin du fichier, ou None si l'URL n'est pas en cache.
+        """
+        if self._read_metadata(url) is None:
+            return None
+        return self._get_paths(url)[0]
+
+    def get_validator(self, url: str) -> Optional[str]:
+        """
+        Retourne le validateur de la version en cache (ETag en priorité,
+        sinon Last-Modified).
+
+        Returns:
+            Optional[str]: Le validateur, ou None si aucun n'est connu.
+        """
+        metadata = self._read_metadata(url)
+        if metadata is None:
+            return None
+        return metadata.get("etag") or metadata.get("last_modified")
+
+    def store(self, url: str, response: requests.Response) -> str:
+        """
+        Écrit le corps d'une réponse et ses validateurs sur disque.
+        Le corps puis les métadonnées sont copiés dans des fichiers temporaires
+        uniques et renommés atomiquement, ce qui évite de laisser une entrée
+        tronquée en cas d'interruption ou d'écritures simultanées.
+
+        Args:
+            url (str): L'URL de la ressource.
+            response (Response): La réponse HTTP (idéalement obtenue avec stream=True).
+
+        Returns:
+            str: Le chemin du corps écrit.
+        """
+        body_path, meta_path = self._get_paths(url)
+
+        with atomic_write(body_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                if chunk:
+                    f.write(chunk)
+
+        metadata = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified")
+        }
+        with atomic_write(meta_path, "w") as f:
+            json.dump(metadata, f)
+
+        return body_path
@@ -0,0 +1,167 @@
+"""
+Tableaux binaires de mesures, lus par projection mémoire (`np.memmap`).
+
+Chaque station occupe un dossier contenant un fichier brut par colonne :
+- `timestamps.i64` : horodatages en nanosecondes depuis l'epoch (UTC), int64 ;
+- `<mesure>.f32` : une mesure par relevé, float32 (NaN si absente) ;
+- `meta.json` : nombre de relevés, colonnes et génération courante.
+
+Les fichiers ne sont jamais modifiés sur place : une nouvelle écriture crée une
+nouvelle génération puis remplace `meta.json`. Les lecteurs partagent le cache
+de pages du système au lieu de désérialiser chacun leur propre copie.
+"""
+import json
+import os
+import shutil
+import time
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List
+from .atomic_file import atomic_write
+
+META_FILE = "meta.json"
+TIMESTAMP_FILE = "timestamps.i64"
+TIMESTAMP_DTYPE = np.dtype("<i8")
+VALUE_DTYPE = np.dtype("<f4")
+
+
+def write_measurement_arrays(
+    df: pd.DataFrame,
+    directory: str,
+    timestamp_col: str,
+    value_columns: List[str]
+) -> Dict[str, Any]:
+    """
+    Écrit les relevés d'une station dans le format binaire.
+
+    Les relevés sont triés par horodatage, un seul par horodatage ; ceux sans
+    horodatage exploitable sont ignorés.
+
+    Args:
+        df (DataFrame): Les relevés de la station.
+        directory (str): Le dossier de la station (créé si nécessaire).
+        timestamp_col (str): Colonne des horodatages (texte ISO ou datetime).
+        value_columns (List[str]): Mesures écrites (une colonne absente est remplie de NaN).
+
+    Returns:
+        Dict[str, Any]: Le contenu de `meta.json`.
+
+    Raises:
+        KeyError: Si la colonne d'horodatage est absente.
+    """
+    if timestamp_col not in df.columns:
+        raise KeyError(f"La colonne '{timestamp_col}' est introuvable.")
+
+    df = df.reset_index(drop=True)
+    readings = pd.DataFrame({"__ts__": pd.to_datetime(df[timestamp_col], utc=True)})
+    readings = readings.dropna().drop_duplicates(subset="__ts__", keep="first").sort_values("__ts__", kind="stable")
+    rows = readings.index
+
+    os.makedirs(directory, exist_ok=True)
+    generation = f"g{time.time_ns()}"
+    generation_dir = os.path.join(directory, generation)
+    os.makedirs(generation_dir)
+
+    epoch_ns = readings["__ts__"].dt.tz_localize(None).to_numpy("datetime64[ns]").view("int64")
+    epoch_ns.astype(TIMESTAMP_DTYPE).tofile(os.path.join(generation_dir, TIMESTAMP_FILE))
+
+    for column in value_columns:
+        if column in df.columns:
+            values = pd.to_numeric(df.loc[rows, column], errors="coerce").to_numpy(dtype=VALUE_DTYPE, na_value=np.nan)
+        else:
+            values = np.full(len(rows), np.nan, dtype=VALUE_DTYPE)
+        values.tofile(os.path.join(generation_dir, f"{column}.f32"))
+
+    meta = {
+        "generation": generation,
+        "rows": len(rows),
+        "timestamp": {"name": timestamp_col, "file": TIMESTAMP_FILE, "unit": "ns", "tz": "UTC"},
+        "columns": [{"name": column, "file": f"{column}.f32"} for column in value_columns]
+    }
+
+    # meta.json remplacé en dernier : un lecteur voit l'ancienne ou la nouvelle génération
+    with atomic_write(os.path.join(directory, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+
+    # Les lecteurs des anciennes générations gardent leurs projections valides
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if name != generation and name.startswith("g") and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+    return meta
+
+
+class MeasurementArrays:
+    """
+    Relevés d'une station projetés en mémoire, en lecture seule.
+
+    Les tableaux exposés sont des vues sur les fichiers : ils ne doivent pas
+    être modifiés, et leur lecture ne charge que les pages effectivement utilisées.
+    """
+
+    OPEN_ATTEMPTS = 3
+
+    def __init__(self, directory: str):
+        """
+        Ouvre les tableaux d'une station.
+
+        Args:
+            directory (str): Le dossier écrit par `write_measurement_arrays`.
+
+        Raises:
+            FileNotFoundError: Si le dossier ne contient pas de tableaux.
+        """
+        # Une écriture concurrente peut supprimer la génération entre la lecture
+        # de meta.json et l'ouverture des fichiers : meta.json est alors relu
+        for attempt in range(self.OPEN_ATTEMPTS):
+            try:
+                self._load(directory)
+                return
+            except FileNotFoundError:
+                if attempt == self.OPEN_ATTEMPTS - 1:
+                    raise
+
+    def _load(self, directory: str) -> None:
+        """Lit meta.json puis projette les fichiers de la génération qu'il désigne."""
+        with open(os.path.join(directory, META_FILE), encoding="utf-8") as f:
+            self.meta: Dict[str, Any] = json.load(f)
+
+        generation_dir = os.path.join(directory, self.meta["generation"])
+        rows = self.meta["rows"]
+
+        self.timestamp_col: str = self.meta["timestamp"]["name"]
+        self.timestamps = self._open(os.path.join(generation_dir, self.meta["timestamp"]["file"]), TIMESTAMP_DTYPE, rows)
+        self.values: Dict[str, np.ndarray] = {
+            spec["name"]: self._open(os.path.join(generation_dir, spec["file"]), VALUE_DTYPE, rows)
+            for spec in self.meta["columns"]
+        }
+
+    @staticmethod
+    def _open(path: str, dtype: np.dtype, rows: int) -> np.ndarray:
+        """Projette un fichier en mémoire (un tableau vide ne peut pas être projeté)."""
+        if rows == 0:
+            if not os.path.exists(path):
+                raise FileNotFoundError(path)
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", shape=(rows,))
+
+    @property
+    def columns(self) -> List[str]:
+        """Les mesures disponibles."""
+        return list(self.values)
+
+    def __len__(self) -> int:
+        """Nombre de relevés."""
+        return self.meta["rows"]
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Construit un DataFrame sur les tableaux projetés, sans copie.
+
+        Returns:
+            DataFrame: Une colonne float32 par mesure, indexée par les horodatages
+                       (UTC, sans fuseau : l'ajout d'un fuseau imposerait une copie).
+        """
+        index = pd.DatetimeIndex(self.timestamps.view("datetime64[ns]"), copy=False, name=self.timestamp_col)
+        return pd.DataFrame(self.values, index=index, columns=self.columns, copy=False)
@@ -0,0 +1,185 @@
+"""Stockage local des relevés de stations, partitionné par station et par jour."""
+import os
+import threading
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from urllib.parse import quote, unquote
+from .columnar import read_frame, resolve_format, write_frame
+
+
+class StationTimeSeriesStore:
+    """
+    Conserve l'historique des relevés de chaque station sur disque, au format
+    colonnaire (npz ou parquet), à raison d'un fichier par station et par jour (UTC) :
+
+        <directory>/<station_id>/<AAAA-MM-JJ>.<format>
+
+    L'ingestion ne fait qu'ajouter : un relevé dont l'horodatage est déjà connu
+    est ignoré, et seules les partitions qui reçoivent de nouveaux relevés sont
+    réécrites. Une requête par période ne lit que les partitions des jours concernés.
+    """
+
+    def __init__(self, directory: str, timestamp_col: str, file_format: str = "auto", timezone: str = "Europe/Paris"):
+        """
+        Initialise le stockage.
+
+        Args:
+            directory (str): Le dossier de stockage (créé si nécessaire).
+            timestamp_col (str): Colonne des horodatages (texte ISO ou datetime).
+            file_format (str): 'npz', 'parquet' ou 'auto'.
+            timezone (str): Fuseau des horodatages renvoyés par les requêtes.
+        """
+        self.directory = os.path.expanduser(directory)
+        self.timestamp_col = timestamp_col
+        self.file_format = resolve_format(file_format)
+        self.timezone = timezone
+        os.makedirs(self.directory, exist_ok=True)
+        # Une ingestion à la fois par station (les partitions sont réécrites en entier)
+        self._station_locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def append(self, station_id: str, df: pd.DataFrame) -> int:
+        """
+        Ajoute des relevés à l'historique d'une station.
+
+        Args:
+            station_id (str): L'identifiant de la station.
+            df (DataFrame): Les relevés (sans horodatage exploitable, ils sont ignorés).
+
+        Returns:
+            int: Le nombre de relevés réellement ajoutés (hors doublons).
+        """
+        if df.empty or self.timestamp_col not in df.columns:
+            return 0
+
+        readings = df.copy()
+        readings[self.timestamp_col] = pd.to_datetime(readings[self.timestamp_col], utc=True)
+        readings = readings.dropna(subset=[self.timestamp_col])
+        readings = readings.drop_duplicates(subset=self.timestamp_col, keep="first")
+
+        station_dir = self._get_station_dir(station_id)
+        os.makedirs(station_dir, exist_ok=True)
+
+        added = 0
+        days = readings[self.timestamp_col].dt.strftime("%Y-%m-%d")
+        with self._get_station_lock(station_id):
+            for day, day_readings in readings.groupby(days.to_numpy(), sort=False):
+                added += self._append_partition(os.path.join(station_dir, f"{day}.{self.file_format}"), day_readings)
+        return added
+
+    def _get_station_lock(self, station_id: str) -> threading.Lock:
+        """Retourne le verrou d'ingestion d'une station."""
+        with self._locks_guard:
+            return self._station_locks.setdefault(station_id, threading.Lock())
+
+    def _append_partition(self, path: str, new_readings: pd.DataFrame) -> int:
+        """
+        Fusionne des relevés d'un même jour à sa partition : les relevés déjà
+        présents l'emportent, la partition reste triée par horodatage.
+        """
+        if os.path.exists(path):
+            existing = read_frame(path, self.file_format)
+            known = pd.to_datetime(existing[self.timestamp_col], utc=True)
+            new_readings = new_readings[~new_readings[self.timestamp_col].isin(known)]
+            if new_readings.empty:
+                return 0
+            partition = pd.concat([existing, new_readings], ignore_index=True)
+        else:
+            partition = new_readings
+
+        partition[self.timestamp_col] = pd.to_datetime(partition[self.timestamp_col], utc=True)
+        partition = partition.sort_values(self.timestamp_col, kind="stable").reset_index(drop=True)
+        write_frame(partition, path, self.file_format)
+        return len(new_readings)
+
+    def query(
+        self,
+        station_id: str,
+        since: Optional[Any] = None,
+        until: Optional[Any] = None,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Lit les relevés d'une station sur une période.
+
+        Args:
+            station_id (str): L'identifiant de la station.
+            since (Optional[Any]): Début de période inclus (str, datetime ou Timestamp).
+            until (Optional[Any]): Fin de période incluse (str, datetime ou Timestamp).
+            columns (Optional[List[str]]): Colonnes à lire (toutes si None) ;
+                l'horodatage est toujours inclus.
+
+        Returns:
+            DataFrame: Les relevés, du plus ancien au plus récent (vide si aucun).
+        """
+        since = self._to_utc(since)
+        until = self._to_utc(until)
+
+        paths = self._get_partitions(station_id, since, until)
+        if not paths:
+            return pd.DataFrame()
+
+        if columns is not None:
+            columns = [self.timestamp_col] + [col for col in columns if col != self.timestamp_col]
+        readings = pd.concat([read_frame(path, self.file_format, columns) for path in paths], ignore_index=True)
+
+        timestamps = readings[self.timestamp_col]
+        mask = pd.Series(True, index=readings.index)
+        if since is not None:
+            mask &= timestamps >= since
+        if until is not None:
+            mask &= timestamps <= until
+
+        readings = readings[mask].reset_index(drop=True)
+        readings[self.timestamp_col] = readings[self.timestamp_col].dt.tz_convert(self.timezone)
+        return readings
+
+    def get_newest_timestamp(self, station_id: str) -> Optional[pd.Timestamp]:
+        """
+        Retourne l'horodatage du relevé le plus récent connu d'une station
+        (seule la dernière partition est lue), ou None si elle n'a aucun relevé.
+        """
+        paths = self._get_partitions(station_id)
+        if not paths:
+            return None
+        timestamps = read_frame(paths[-1], self.file_format, [self.timestamp_col])[self.timestamp_col]
+        return pd.to_datetime(timestamps, utc=True).max()
+
+    def get_stations(self) -> List[str]:
+        """Retourne les identifiants des stations ayant au moins une partition."""
+        return sorted(unquote(name) for name in os.listdir(self.directory)
+                      if self._get_partitions(unquote(name)))
+
+    def _get_partitions(
+        self,
+        station_id: str,
+        since: Optional[pd.Timestamp] = None,
+        until: Optional[pd.Timestamp] = None
+    ) -> List[str]:
+        """Chemins des partitions d'une station couvrant la période, dans l'ordre chronologique."""
+        station_dir = self._get_station_dir(station_id)
+        if not os.path.isdir(station_dir):
+            return []
+
+        suffix = f".{self.file_format}"
+        first_day = None if since is None else since.strftime("%Y-%m-%d")
+        last_day = None if until is None else until.strftime("%Y-%m-%d")
+
+        # Les noms AAAA-MM-JJ se comparent comme des dates
+        days = sorted(name[:-len(suffix)] for name in os.listdir(station_dir) if name.endswith(suffix))
+        return [
+            os.path.join(station_dir, f"{day}{suffix}") for day in days
+            if (first_day is None or day >= first_day) and (last_day is None or day <= last_day)
+        ]
+
+    def _get_station_dir(self, station_id: str) -> str:
+        """Retourne le dossier d'une station (identifiant échappé pour le système de fichiers)."""
+        return os.path.join(self.directory, quote(station_id, safe=""))
+
+    @staticmethod
+    def _to_utc(value: Optional[Any]) -> Optional[pd.Timestamp]:
+        """Convertit une borne de période en Timestamp UTC (une borne naïve est lue en UTC)."""
+        if value is None:
+            return None
+        timestamp = pd.Timestamp(value)
+        return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp.tz_convert("UTC")